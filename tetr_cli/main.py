@@ -2,9 +2,8 @@
 
 # coding: utf-8
 
-from asyncio import sleep
 from time import perf_counter
-from typing import Set, Dict, List
+from typing import Set, Dict, List, Optional
 
 import curses
 from curses import (
@@ -31,18 +30,25 @@ from curses import (
     KEY_RESIZE,
 )
 from pygame import mixer
-from pygame.mixer import Sound
 
-from tetr_cli.tetr_modules.keyboard_handlers.curses_handler import curses_key_name
+from tetr_cli.tetr_modules.keyboard_handlers.curses_handler import (
+    KeyEvent,
+    KeyRepeatModel,
+    drain_key_events,
+)
+from tetr_cli.tetr_modules.keyboard_handlers.key_event_queue import KeyEventQueue
 
-from tetr_cli.tetr_modules.mode import GameMode
+from tetr_cli.tetr_modules.mode import GameMode, ModeRegistry
 from tetr_cli.tetr_modules.modules.checker import (
     screen_dimension_check,
     screen_dimension_warning,
 )
-from tetr_cli.tetr_modules.modules.debug import DebugClass
+from tetr_cli.tetr_modules.modules.debug import DebugClass, FrameProfiler
 from tetr_cli.tetr_modules.modules.database import get_setting
-from tetr_cli.tetr_modules.modules.sound import load_sfx, play_sounds
+from tetr_cli.tetr_modules.modules.replay import ReplayRecorder
+from tetr_cli.tetr_modules.modules.safe_curses import DrawBuffer
+from tetr_cli.tetr_modules.modules.scheduler import FrameScheduler
+from tetr_cli.tetr_modules.modules.sound import AudioAssetManager, AudioDispatcher
 
 # O, I, T, L, J, S, Z
 
@@ -76,17 +82,28 @@ async def main(
     debug_mode: bool,
     ncurses_mode: bool = True,
     no_music_mode: bool = False,
+    record_replay: bool = False,
+    key_event_queue: Optional[KeyEventQueue] = None,
 ) -> None:
     """The true main code or base of everything."""
     debug_stats: DebugClass = DebugClass()
+    profiler: FrameProfiler = FrameProfiler(enabled=debug_mode)
+    if key_event_queue is not None:
+        profiler.watch("input_latency", key_event_queue.latency)
 
     audio_check: bool = not no_music_mode
-    try:
-        mixer.init()
-        mixer.music.set_volume(0.25)
-        sound_effect_dict: Dict[str, Sound] = await load_sfx()
-    except Exception:
-        audio_check = False
+    audio_assets: AudioAssetManager = AudioAssetManager()
+    audio_dispatcher: AudioDispatcher = AudioDispatcher(audio_assets)
+    if audio_check:
+        try:
+            mixer.init()
+            mixer.music.set_volume(0.25)
+            # Decoded while the main menu is already up
+            audio_assets.start_preload()
+            audio_dispatcher.start()
+            profiler.add_report("audio", audio_assets.report)
+        except Exception:
+            audio_check = False
 
     stdscr: window = initscr()
     start_color()
@@ -96,10 +113,16 @@ async def main(
     stdscr.keypad(True)
 
     stdscr.nodelay(True)
-    key_input: int = 0
-    current_mode: GameMode = GameMode()
+    key_events: List[KeyEvent] = []
+    key_repeat: KeyRepeatModel = KeyRepeatModel()
+    mode_registry: ModeRegistry = ModeRegistry(TRANSITION_LIST.values())
+    current_mode: GameMode = GameMode(
+        recorder=ReplayRecorder() if record_replay else None,
+        registry=mode_registry,
+    )
     current_mode.change_mode("main_menu")
-    current_bgm: str = ""
+    mode_registry.start_warming()
+    profiler.watch("transition", current_mode.transition_latency)
 
     use_default_colors()
 
@@ -122,60 +145,77 @@ async def main(
         init_pair(7, COLOR_RED, -1)  # Z
         init_pair(8, COLOR_WHITE, COLOR_BLACK)  # Light gray on black
 
-    start_time: float = 0.0
-    elapsed_time: float = 0.0
-
     frame_limit: int = int(get_setting("FPS_limit"))
-    frame_duration: float = 1 / frame_limit
+    scheduler: FrameScheduler = FrameScheduler(frame_limit)
+    profiler.watch("tick_jitter", scheduler.jitter)
+    ticks: int = 1
+    # Renderers draw into this, it is flushed as merged runs once per frame
+    draw_buffer: DrawBuffer = DrawBuffer(stdscr)
 
     try:
         while True:
-            if elapsed_time < frame_duration:
-                await sleep(frame_duration - elapsed_time)
-            start_time = perf_counter()
+            profiler.start_frame()
+            ticks = await scheduler.wait()
+            profiler.mark("sleep")
 
-            key_input = stdscr.getch()
+            # Every key read this frame is applied this frame
+            key_events = drain_key_events(stdscr)
             # stdscr.clear()
 
-            if key_input == KEY_RESIZE:
+            if any(key_code == KEY_RESIZE for _, key_code in key_events):
                 resize_term(*stdscr.getmaxyx())
                 stdscr.clear()
+                current_mode.invalidate_draw_cache()
                 stdscr.refresh()
 
             if ncurses_mode:
-                if key_input == -1:
-                    pressed_keys.clear()
-                else:
-                    pressed_keys.update(curses_key_name(key_input))
+                key_repeat.feed(key_events)
+                pressed_keys.clear()
+                pressed_keys.update(key_repeat.update(perf_counter()))
+            elif key_event_queue is not None:
+                pressed_keys.clear()
+                pressed_keys.update(key_event_queue.drain(perf_counter()))
+            profiler.mark("getch")
 
-            stdscr.noutrefresh()
+            draw_buffer.begin_frame()
 
             if debug_mode:
                 debug_stats.update_keypress(keypress=pressed_keys)
                 debug_stats.update_current_mode(
-                    new_mode=current_mode.get_current_mode_name()
+                    new_mode=current_mode.get_current_mode_name(),
+                    transition_time=current_mode.last_transition_time,
                 )
-                debug_stats.update_debug(stdscr=stdscr)
-
-            current_mode.increment_frame(stdscr=stdscr, pressed_keys=pressed_keys)
+                debug_stats.update_debug(
+                    stdscr=draw_buffer, profiler=profiler, scheduler=scheduler
+                )
+            profiler.mark("debug")
+
+            # Ticks missed while the terminal stalled only run the game logic
+            for _ in range(ticks - 1):
+                current_mode.catch_up(pressed_keys=pressed_keys)
+            current_mode.increment_frame(stdscr=draw_buffer, pressed_keys=pressed_keys)
+            profiler.mark("increment_frame")
+            draw_buffer.noutrefresh()
+            profiler.mark("flush")
             doupdate()
+            profiler.mark("doupdate")
 
             if await screen_dimension_check(stdscr=stdscr) is False:
                 stdscr.clear()
+                current_mode.invalidate_draw_cache()
                 await screen_dimension_warning(stdscr=stdscr)
                 if debug_mode:
-                    debug_stats.update_debug(stdscr=stdscr)
+                    debug_stats.update_debug(
+                        stdscr=draw_buffer, profiler=profiler, scheduler=scheduler
+                    )
+                draw_buffer.noutrefresh()
                 doupdate()
-                elapsed_time = perf_counter() - start_time
+                profiler.end_frame()
                 continue
 
             if audio_check:
-                sound_action: Dict[str, List[str]] = current_mode.get_sound_action()
-                current_bgm = await play_sounds(
-                    sound_action=sound_action,
-                    current_bgm=current_bgm,
-                    sound_effect_dict=sound_effect_dict,
-                )
+                audio_dispatcher.submit(current_mode.get_sound_action())
+            profiler.mark("play_sounds")
 
             actions: Dict[str, List[str]] = current_mode.get_mode_action()
             if "transition" in actions:
@@ -186,21 +226,31 @@ async def main(
                     transition=transition_value, current_mode=current_mode
                 )
                 stdscr.clear()
+                current_mode.invalidate_draw_cache()
                 if pressed_keys is not None:
                     pressed_keys.clear()
+                key_repeat.release_all()
+                if key_event_queue is not None:
+                    key_event_queue.release_all()
 
             if "clear" in actions:
                 stdscr.clear()
+                current_mode.invalidate_draw_cache()
                 stdscr.refresh()
 
             if "update_fps" in actions:
                 frame_limit = int(get_setting("FPS_limit"))
-                frame_duration = 1 / frame_limit
-            elapsed_time = perf_counter() - start_time
+                scheduler.set_frame_limit(frame_limit)
+            profiler.mark("actions")
+            profiler.end_frame()
     except KeyboardInterrupt:
         pass
+    finally:
+        current_mode.stop_recording()
+        profiler.dump_json()
 
     if mixer and audio_check:
+        audio_dispatcher.stop()
         mixer.music.stop()
         mixer.quit()
     nocbreak()
@@ -4,8 +4,9 @@
 
 from asyncio import run, CancelledError
 from curses import endwin, isendwin
+from pathlib import Path
 from sys import argv, exit as sys_exit
-from threading import Lock
+from time import perf_counter
 from typing import Dict, List, Set
 
 try:
@@ -16,8 +17,13 @@ except ImportError:
     NO_PYNPUT = True
 
 from tetr_cli.main import main
+from tetr_cli.tetr_modules.keyboard_handlers.key_event_queue import KeyEventQueue
 from tetr_cli.tetr_modules.modules.database import initialize_database
+from tetr_cli.tetr_modules.modules.replay import Replay, play_replay
+from tetr_cli.tetr_modules.game_check import run_game_check
 from tetr_cli.tetr_modules.input_test import run_input_test_mode
+from tetr_cli.tetr_modules.render_bench import run_render_bench
+from tetr_cli.tetr_modules.solo_core.game_state import GameState
 
 try:
     from tetr_cli.tetr_modules.keyboard_handlers.pynput_handler import (
@@ -28,10 +34,15 @@ except ImportError:
 
 help_dict: Dict[str, str] = {
     "--help, -h": "Display this help information.",
-    "--debug, -d": "Enable debug mode with additional logging.",
+    "--debug, -d": "Enable debug mode with a frame profiler, saved to frame_profile.json on exit.",
     "--curses, --ncurses, --c": "Enable ncurses mode for terminal-based UI.",
     "--no-music, --nm": "Disable music playback during the game.",
     "--reset-db, --reset-database, --r": "Reset the game database to default settings.",
+    "--record, -rec": "Record a replay of every solo game into the replays folder.",
+    "--replay <file>": "Play a recorded replay without a terminal and print the result.",
+    "--realtime": "Play the replay at real time instead of as fast as possible.",
+    "--render-bench": "Time the renderers on an in-memory window and print the cost per frame.",
+    "--game-check": "Run seeded headless games and check the solo core for regressions.",
 }
 
 
@@ -40,6 +51,33 @@ def parse_flag(flag_aliases: List[str]) -> bool:
     return any(flag in argv for flag in flag_aliases)
 
 
+def parse_value(flag_aliases: List[str]) -> str:
+    """Get the value given after any of the given flag aliases, or an empty string."""
+    for index, argument in enumerate(argv[:-1]):
+        if argument in flag_aliases:
+            return argv[index + 1]
+    return ""
+
+
+def run_replay(replay_file: str, realtime: bool) -> None:
+    """Play a replay headlessly and print the result."""
+    try:
+        replay: Replay = Replay.load(Path(replay_file))
+    except (OSError, ValueError) as error:
+        print(f"Cannot play {replay_file}: {error}")
+        return
+    start_time: float = perf_counter()
+    game: GameState = run(play_replay(replay, realtime=realtime))
+    elapsed_time: float = perf_counter() - start_time
+
+    print(f"Replay: {replay_file}")
+    print(f"Frames: {replay.frame_count} in {elapsed_time:.3f}s")
+    print(f"Score: {game.score} (recorded {replay.score})")
+    print(f"Lines: {game.lines_cleared} Level: {game.level}")
+    if game.score != replay.score:
+        print("Warning: the replayed score does not match the recording!")
+
+
 def print_help() -> None:
     """Print help information for command-line flags."""
     print("\n\n")
@@ -64,11 +102,22 @@ def starter() -> None:
     print_help_call: bool = parse_flag(["--help", "-h"])
 
     input_test: bool = parse_flag(["--input-test", "-it"])
+    record_replay: bool = parse_flag(["--record", "-rec"])
+    replay_file: str = parse_value(["--replay"])
+    render_bench: bool = parse_flag(["--render-bench"])
+    game_check: bool = parse_flag(["--game-check"])
 
     if print_help_call:
         print_help()
         return
 
+    if replay_file:
+        run_replay(replay_file, realtime=parse_flag(["--realtime"]))
+        return
+
+    if game_check:
+        sys_exit(0 if run_game_check() else 1)
+
     if reset_database:
         print("\n\n")
         input_key: str = ""
@@ -86,19 +135,23 @@ def starter() -> None:
 
     initialize_database()
 
+    if render_bench:
+        run_render_bench()
+        return
+
     if NO_PYNPUT:
         ncurses_mode = True
 
     pressed_keys: Set[str] = set()
+    key_event_queue: KeyEventQueue = KeyEventQueue()
 
     if not ncurses_mode:
-        lock: Lock = Lock()
-        listener: keyboard.Listener = setup_pynput_listener(pressed_keys, lock)
+        listener: keyboard.Listener = setup_pynput_listener(key_event_queue)
         listener.start()
 
     if input_test:
         try:
-            run(run_input_test_mode(pressed_keys, ncurses_mode))
+            run(run_input_test_mode(pressed_keys, ncurses_mode, key_event_queue))
         except (CancelledError, KeyboardInterrupt):
             print("Input test mode exited.")
         return
@@ -110,6 +163,8 @@ def starter() -> None:
                 debug_mode=debug_mode,
                 ncurses_mode=ncurses_mode,
                 no_music_mode=no_music_mode,
+                record_replay=record_replay,
+                key_event_queue=None if ncurses_mode else key_event_queue,
             )
         )
         print("\n\n")
@@ -0,0 +1,89 @@
+"""This will run seeded headless games and check the solo core for regressions."""
+
+# coding: utf-8
+
+from gc import collect, get_objects
+from random import Random
+from typing import Callable, Dict, Tuple
+
+from tetr_cli.tetr_modules.modules.constants import GAME_ACTION_MASK
+from tetr_cli.tetr_modules.modules.keybinds import MOVE_LEFT, MOVE_RIGHT
+from tetr_cli.tetr_modules.solo_core.game_state import GameState
+from tetr_cli.tetr_modules.solo_core.mino import Mino
+
+
+CHECK_FPS_LIMIT: int = 30
+CHECK_SEED: int = 5
+CHECK_GAMES: int = 20
+# Frames a game may run before it is cut short
+CHECK_MAX_FRAMES: int = 20000
+
+
+def count_live_minos() -> int:
+    """This will return how many Mino instances are still reachable."""
+    collect()
+    return sum(1 for item in get_objects() if isinstance(item, Mino))
+
+
+def play_random_game(seed: int, max_frames: int = CHECK_MAX_FRAMES) -> Tuple[int, int]:
+    """This will play a game with seeded random inputs and return (frames, score)."""
+    rng: Random = Random(seed)
+    game: GameState = GameState(fps_limit=CHECK_FPS_LIMIT, input_seed=seed)
+    frames: int = 0
+    while not game.game_over and frames < max_frames:
+        inputs: int = 0
+        if rng.random() < 0.4:
+            inputs = rng.randrange(GAME_ACTION_MASK + 1)
+        game.step(inputs)
+        frames += 1
+    return frames, game.score
+
+
+def check_mino_leaks(games: int = CHECK_GAMES) -> bool:
+    """This will check that no Mino outlives the games it was made for."""
+    before: int = count_live_minos()
+    for game_number in range(games):
+        play_random_game(CHECK_SEED + game_number)
+    leaked: int = count_live_minos() - before
+    print(f"Mino leaks: {leaked} live after {games} games")
+    return leaked == 0
+
+
+def check_sideways_taps(taps: int = 3, idle_steps: int = 2) -> bool:
+    """This will check that separate one step move taps each move one cell."""
+    game: GameState = GameState(fps_limit=CHECK_FPS_LIMIT, input_seed=CHECK_SEED)
+    game.step(0)
+    passed: bool = True
+    for move, step in ((MOVE_LEFT, -1), (MOVE_RIGHT, 1)):
+        for _ in range(taps):
+            if game.current_mino is None:
+                return False
+            start_x: int = game.current_mino.position[1]
+            game.step(move)
+            for _ in range(idle_steps):
+                game.step(0)
+            if game.current_mino is None:
+                return False
+            passed = passed and game.current_mino.position[1] == start_x + step
+    print(f"Sideways taps: {'each moved one cell' if passed else 'a tap did not move'}")
+    return passed
+
+
+GAME_CHECKS: Dict[str, Callable[[], bool]] = {
+    "mino_leaks": check_mino_leaks,
+    "sideways_taps": check_sideways_taps,
+}
+
+
+def run_game_check() -> bool:
+    """This will run every check, print the results and return whether all passed."""
+    failed: Tuple[str, ...] = tuple(name for name, check in GAME_CHECKS.items() if not check())
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+        return False
+    print("All game checks passed.")
+    return True
+
+
+if __name__ == "__main__":
+    print("This module is not meant to be run directly, use starter.py --game-check.")
@@ -11,15 +11,18 @@ from curses import (
     start_color,
     window,
 )
-from typing import Set
+from time import perf_counter
+from typing import Optional, Set
 
 from tetr_cli.tetr_modules.keyboard_handlers.curses_handler import curses_key_name
+from tetr_cli.tetr_modules.keyboard_handlers.key_event_queue import KeyEventQueue
 from tetr_cli.tetr_modules.modules.safe_curses import safe_addstr
 
 
 async def run_input_test_mode(
     pressed_keys: Set[str],
     ncurses_mode: bool = True,
+    key_event_queue: Optional[KeyEventQueue] = None,
 ) -> None:
     """Run the input test mode."""
     stdscr: window = initscr()
@@ -44,6 +47,9 @@ async def run_input_test_mode(
                     pressed_keys.clear()
                     pressed_keys.add(f"{key}")
                     pressed_keys.update(curses_key_name(key))
+            elif key_event_queue is not None:
+                pressed_keys.clear()
+                pressed_keys.update(key_event_queue.drain(perf_counter()))
 
             stdscr.move(1, 0)
             stdscr.clrtoeol()
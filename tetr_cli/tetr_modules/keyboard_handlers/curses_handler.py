@@ -1,10 +1,13 @@
 """This is a handler for keyboard input using curses."""
 # coding: utf-8
 
-from typing import Dict, Set
+from time import perf_counter
+from typing import Dict, List, Set, Tuple
 
 from curses import (
     keyname,
+    window,
+    KEY_RESIZE,
     KEY_UP,
     KEY_DOWN,
     KEY_LEFT,
@@ -36,6 +39,15 @@ from curses import (
     KEY_F12,
 )
 
+from tetr_cli.tetr_modules.modules.constants import (
+    KEY_REPEAT_DELAY,
+    KEY_REPEAT_INTERVAL,
+    MAX_KEY_EVENTS,
+)
+
+# (perf_counter time it was read, key code)
+KeyEvent = Tuple[float, int]
+
 
 KEY_NAME_CONVERTER: Dict[str, str] = {
     " ": "space",
@@ -111,5 +123,74 @@ def curses_key_name(key_code: int) -> Set[str]:
         return {f"unknown_key_{key_code}"}
 
 
+def drain_key_events(stdscr: window, max_events: int = MAX_KEY_EVENTS) -> List[KeyEvent]:
+    """Read every pending key code from a nodelay window, with the time each was read."""
+    key_events: List[KeyEvent] = []
+    while len(key_events) < max_events:
+        key_code: int = stdscr.getch()
+        if key_code == -1:
+            break
+        key_events.append((perf_counter(), key_code))
+    return key_events
+
+
+class KeyRepeatModel:
+    """Turns curses key presses into the names of the keys held.
+
+    Terminals never report a release, they repeat the press while the key is
+    down. A key read again within repeat_delay of its last press counts as
+    repeating, and stays held until no repeat arrives for repeat_interval.
+    A single press is held only in the frame it was read.
+    """
+
+    def __init__(
+        self,
+        repeat_delay: float = KEY_REPEAT_DELAY,
+        repeat_interval: float = KEY_REPEAT_INTERVAL,
+    ) -> None:
+        """Initializes the variables."""
+        self.repeat_delay: float = repeat_delay
+        self.repeat_interval: float = repeat_interval
+        self.__last_press: Dict[str, float] = {}
+        self.__repeating: Set[str] = set()
+        self.__frame_keys: Set[str] = set()
+
+    def feed(self, key_events: List[KeyEvent]) -> None:
+        """Adds the key events read this frame."""
+        for timestamp, key_code in key_events:
+            if key_code == KEY_RESIZE:
+                continue
+            for key_name in curses_key_name(key_code):
+                last_press: float = self.__last_press.get(key_name, -self.repeat_delay)
+                if timestamp - last_press <= self.repeat_delay:
+                    self.__repeating.add(key_name)
+                self.__last_press[key_name] = timestamp
+                self.__frame_keys.add(key_name)
+
+    def update(self, now: float) -> Set[str]:
+        """Works out the keys held at the given time, and returns them."""
+        held: Set[str] = self.__frame_keys
+        for key_name in list(self.__repeating):
+            if now - self.__last_press[key_name] <= self.repeat_interval:
+                held.add(key_name)
+            else:
+                self.__repeating.discard(key_name)
+        for key_name in [
+            key_name
+            for key_name, last_press in self.__last_press.items()
+            if now - last_press > self.repeat_delay
+        ]:
+            del self.__last_press[key_name]
+
+        self.__frame_keys = set()
+        return held
+
+    def release_all(self) -> None:
+        """Forgets the held keys, so the next press counts as a new single press."""
+        self.__last_press.clear()
+        self.__repeating.clear()
+        self.__frame_keys.clear()
+
+
 if __name__ == "__main__":
     print("This is a module, please run the starter.py.")
@@ -0,0 +1,54 @@
+"""This will carry key transitions from the pynput thread to the frame loop."""
+# coding: utf-8
+
+from collections import deque
+from time import perf_counter
+from typing import Deque, Set, Tuple
+
+from tetr_cli.tetr_modules.modules.debug import LatencyHistogram
+
+# (perf_counter time, key name, True when pressed and False when released)
+KeyTransition = Tuple[float, str, bool]
+
+
+class KeyEventQueue:
+    """Holds key transitions until the frame loop drains them.
+
+    The listener thread only appends to a deque and the frame loop only pops
+    from it. Both are atomic, so neither side takes a lock. A key pressed and
+    released within one frame is still down in that frame. The deque is not
+    capped, as dropping a release would leave its key held.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the variables."""
+        self.__events: Deque[KeyTransition] = deque()
+        self.__held: Set[str] = set()
+
+        # Microseconds from each transition to the frame that read it
+        self.latency: LatencyHistogram = LatencyHistogram()
+
+    def push(self, key_name: str, is_down: bool) -> None:
+        """Adds a transition, called from the listener thread."""
+        self.__events.append((perf_counter(), key_name, is_down))
+
+    def drain(self, now: float) -> Set[str]:
+        """Applies the transitions since the last frame and returns the keys down in it."""
+        tapped_keys: Set[str] = set()
+        while self.__events:
+            timestamp, key_name, is_down = self.__events.popleft()
+            if is_down:
+                self.__held.add(key_name)
+                tapped_keys.add(key_name)
+            else:
+                self.__held.discard(key_name)
+            self.latency.record(int((now - timestamp) * 1_000_000))
+        return self.__held | tapped_keys
+
+    def release_all(self) -> None:
+        """Forgets the held keys, they come back with their next press or repeat."""
+        self.__held.clear()
+
+
+if __name__ == "__main__":
+    print("This is a module, please run the starter.py.")
@@ -1,11 +1,10 @@
 """This is the sub-main if pynput is available."""
 # coding: utf-8
 
-from threading import Lock
-from typing import Set
-
 from pynput import keyboard  # type: ignore
 
+from tetr_cli.tetr_modules.keyboard_handlers.key_event_queue import KeyEventQueue
+
 
 def _name_of_key(key: str) -> str:
     """Get the name of the key and serialize it."""
@@ -22,20 +21,17 @@ def _name_of_key(key: str) -> str:
 
 
 def setup_pynput_listener(
-    pressed_keys: Set[str],
-    lock: Lock
+    key_event_queue: KeyEventQueue
 ) -> keyboard.Listener:
     """Setup the pynput listener for keyboard input."""
 
     def on_key_press(key) -> None:
         """This is an event catcher when key is pressed"""
-        with lock:
-            pressed_keys.add(_name_of_key(key))
+        key_event_queue.push(_name_of_key(key), True)
 
     def on_key_release(key) -> None:
         """This is an event catcher when key is released"""
-        with lock:
-            pressed_keys.discard(_name_of_key(key))
+        key_event_queue.push(_name_of_key(key), False)
 
     listener: keyboard.Listener = keyboard.Listener(
         on_press=on_key_press,
@@ -1,25 +1,46 @@
 """This is the whole base module for Tetr CLI modes."""
 # coding: utf-8
 
-from copy import deepcopy
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
-from tetr_cli.tetr_modules.modules.database import load_keybinds, get_setting
+from tetr_cli.tetr_modules.modules.database import (
+    get_setting,
+    load_keybind_table,
+    load_keybinds,
+)
+from tetr_cli.tetr_modules.modules.keybinds import KeybindTable
+from tetr_cli.tetr_modules.modules.mode_context import ModeContext
 
 
 class BaseModeClass:
     """This is the base class for all modes."""
 
-    def __init__(self) -> None:
+    # Kept by the mode registry when left, and resumed when entered again
+    suspendable: bool = False
+
+    def __init__(self, context: Optional[ModeContext] = None) -> None:
         """Initialize the base mode class."""
-        self.__fps: int = int(get_setting("FPS_limit"))
-        if self.__fps == 0:
-            self.__fps = 30
+        # Handed over by the previous mode, and to the next mode
+        self.context: ModeContext = context if context is not None else ModeContext()
+        self.handoff: Optional[ModeContext] = None
+        self.__fps: int = 30
+        # Two buffers per channel: the mode writes into one while the main loop
+        # reads the other, so popping swaps them instead of copying.
         self.__action: Dict[str, List[str]] = {}
+        self.__spare_action: Dict[str, List[str]] = {}
         self.__sound_action: Dict[str, List[str]] = {"BGM": ["stop"], "SFX": []}
-        self.__user_keybinds: Dict[str, Dict[str, Set[str]]] = load_keybinds()
+        self.__spare_sound_action: Dict[str, List[str]] = {"BGM": ["stop"], "SFX": []}
+        self.__user_keybinds: Dict[str, Dict[str, Set[str]]] = {}
+        self.__keybind_table: KeybindTable
+        self.__load_settings()
         # print(f"Loaded keybinds: {self.__user_keybinds}")
 
+    def __load_settings(self) -> None:
+        """This will read the fps limit and keybinds from the settings store."""
+        self.__fps = int(get_setting("FPS_limit")) or 30
+        self.__user_keybinds = load_keybinds()
+        self.__keybind_table = load_keybind_table()
+
     @property
     def fps_limit(self) -> int:
         """This will return the fps."""
@@ -60,16 +81,49 @@ class BaseModeClass:
             return self.__user_keybinds["menu_keys"][input_name]
         return self.__user_keybinds["game_keys"][input_name]
 
+    def get_action_mask(self, pressed_keys: Set[str]) -> int:
+        """This will return the bits (see ACTION_BITS) of the actions pressed."""
+        return self.__keybind_table.action_mask(pressed_keys)
+
+    def resume(self, context: Optional[ModeContext] = None) -> None:
+        """This will prepare a suspended mode to be entered again."""
+        self.context = context if context is not None else ModeContext()
+        self.handoff = None
+        self.__action.clear()
+        self.__sound_action["SFX"].clear()
+        # The settings may have changed while the mode was suspended
+        self.__load_settings()
+
+    def catch_up(self, pressed_keys: Set[str]) -> None:
+        """This will run one logic tick without drawing, when the main loop is behind."""
+        # Menus only count rendered frames, so there is nothing to catch up.
+
+    def invalidate_draw_cache(self) -> None:
+        """This will forget what was drawn, after the screen was cleared."""
+        # Menus redraw everything every frame, so there is nothing to forget.
+
     def pop_action(self) -> Dict[str, List[str]]:
-        """This will return the action and reset it."""
-        actions: Dict[str, List[str]] = deepcopy(self.__action)
-        self.__action = {}
+        """This will return the action and reset it.
+
+        The returned dict is reused, it is only valid until the next pop.
+        """
+        actions: Dict[str, List[str]] = self.__action
+        self.__spare_action.clear()
+        self.__action = self.__spare_action
+        self.__spare_action = actions
         return actions
 
     def pop_sound_action(self) -> Dict[str, List[str]]:
-        """This will return the sound action and reset it."""
-        sound_action: Dict[str, List[str]] = deepcopy(self.__sound_action)
-        self.__sound_action["SFX"] = []
+        """This will return the sound action and reset its SFX, keeping the BGM.
+
+        The returned dict is reused, it is only valid until the next pop.
+        """
+        sound_action: Dict[str, List[str]] = self.__sound_action
+        spare: Dict[str, List[str]] = self.__spare_sound_action
+        spare["BGM"] = sound_action["BGM"]
+        spare["SFX"].clear()
+        self.__sound_action = spare
+        self.__spare_sound_action = sound_action
         return sound_action
 
 
@@ -3,9 +3,18 @@
 # coding: utf-8
 
 from curses import A_BOLD, A_REVERSE
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 from tetr_cli.tetr_modules.menu_core.base_mode import BaseModeClass
+from tetr_cli.tetr_modules.modules.keybinds import (
+    MENU_BACK,
+    MENU_CONFIRM,
+    MENU_DOWN,
+    MENU_LEFT,
+    MENU_RIGHT,
+    MENU_UP,
+)
+from tetr_cli.tetr_modules.modules.mode_context import ModeContext
 from tetr_cli.tetr_modules.modules.safe_curses import (
     calculate_centered_menu,
     safe_addstr,
@@ -15,11 +24,17 @@ from tetr_cli.tetr_modules.modules.safe_curses import (
 class VerticalMenuModeClass(BaseModeClass):
     """This class holds the basic features for the menu mode."""
 
+    # Menus keep their cursor, so going back lands on the option that was picked
+    suspendable: bool = True
+
     def __init__(
-        self, option_list: List[str], option_to_action: Dict[str, Dict[str, str]]
+        self,
+        option_list: List[str],
+        option_to_action: Dict[str, Dict[str, str]],
+        context: Optional[ModeContext] = None,
     ) -> None:
         """This will initialize this class."""
-        super().__init__()
+        super().__init__(context)
         self.__selected_option: int = 0
         self.__key_cooldown: int = 0
         self.__options: List[str] = option_list
@@ -27,19 +42,20 @@ class VerticalMenuModeClass(BaseModeClass):
 
     def menu_control(self, pressed_keys: Set) -> None:
         """This will handle the menu controls."""
+        actions: int = self.get_action_mask(pressed_keys)
         if self.__key_cooldown > 0:
             self.__key_cooldown -= 1
-        elif self.get_user_keybind("menu_up", menu_mode=True) & pressed_keys:
+        elif actions & MENU_UP:
             self.__selected_option = max(0, self.__selected_option - 1)
             self.__key_cooldown = 3
             self.sound_action["SFX"].append("select_move")
-        elif self.get_user_keybind("menu_down", menu_mode=True) & pressed_keys:
+        elif actions & MENU_DOWN:
             self.__selected_option = min(
                 len(self.__options) - 1, self.__selected_option + 1
             )
             self.__key_cooldown = 3
             self.sound_action["SFX"].append("select_move")
-        elif self.get_user_keybind("menu_confirm", menu_mode=True) & pressed_keys:
+        elif actions & MENU_CONFIRM:
             transition_name: str = self.__options[self.__selected_option]
             self.action["transition"] = [
                 self.__option_to_action[transition_name]["action"]
@@ -47,7 +63,7 @@ class VerticalMenuModeClass(BaseModeClass):
             self.sound_action["SFX"].append(
                 self.__option_to_action[transition_name]["sound"]
             )
-        elif self.get_user_keybind("menu_back", menu_mode=True) & pressed_keys:
+        elif actions & MENU_BACK:
             self.action["transition"] = [self.__option_to_action["Go_Back"]["action"]]
             self.sound_action["SFX"].append(self.__option_to_action["Go_Back"]["sound"])
 
@@ -87,29 +103,30 @@ class TwoDimmMenuModeClass(BaseModeClass):
 
     def menu_control(self, pressed_keys: Set) -> None:
         """This will handle the menu controls."""
+        actions: int = self.get_action_mask(pressed_keys)
         if self.__key_cooldown > 0:
             self.__key_cooldown -= 1
-        elif self.get_user_keybind("menu_up", menu_mode=True) & pressed_keys:
+        elif actions & MENU_UP:
             self.__selected_option[1] = max(0, self.__selected_option[1] - 1)
             self.__key_cooldown = 3
             self.sound_action["SFX"].append("select_move")
-        elif self.get_user_keybind("menu_down", menu_mode=True) & pressed_keys:
+        elif actions & MENU_DOWN:
             self.__selected_option[1] = min(
                 len(self.__options[0]) - 1, self.__selected_option[1] + 1
             )
             self.__key_cooldown = 3
             self.sound_action["SFX"].append("select_move")
-        elif self.get_user_keybind("menu_left", menu_mode=True) & pressed_keys:
+        elif actions & MENU_LEFT:
             self.__selected_option[0] = max(0, self.__selected_option[0] - 1)
             self.__key_cooldown = 3
             self.sound_action["SFX"].append("select_move")
-        elif self.get_user_keybind("menu_right", menu_mode=True) & pressed_keys:
+        elif actions & MENU_RIGHT:
             self.__selected_option[0] = min(
                 len(self.__options) - 1, self.__selected_option[0] + 1
             )
             self.__key_cooldown = 3
             self.sound_action["SFX"].append("select_move")
-        elif self.get_user_keybind("menu_confirm", menu_mode=True) & pressed_keys:
+        elif actions & MENU_CONFIRM:
             transition_name: str = self.__options[
                 self.__selected_option[0]
             ][self.__selected_option[1]]
@@ -119,7 +136,7 @@ class TwoDimmMenuModeClass(BaseModeClass):
             self.sound_action["SFX"].append(
                 self.__option_to_action[transition_name]["sound"]
             )
-        elif self.get_user_keybind("menu_back", menu_mode=True) & pressed_keys:
+        elif actions & MENU_BACK:
             self.action["transition"] = [self.__option_to_action["Go_Back"]["action"]]
             self.sound_action["SFX"].append(self.__option_to_action["Go_Back"]["sound"])
 
@@ -3,17 +3,94 @@
 # coding: utf-8
 
 from importlib import import_module
-from typing import Dict, List, Set
+from threading import Thread
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Set, Type
 
 from curses import window
 
+from tetr_cli.tetr_modules.menu_core.base_mode import BaseModeClass
+from tetr_cli.tetr_modules.modules.debug import LatencyHistogram
+from tetr_cli.tetr_modules.modules.mode_context import ModeContext
+from tetr_cli.tetr_modules.modules.replay import ReplayRecorder
+from tetr_cli.tetr_modules.solo_core.base import SoloBaseMode
+
+
+class ModeRegistry:
+    """This will resolve the mode classes once and keep suspended menu modes.
+
+    Modes whose class sets suspendable are kept when left, and are resumed
+    instead of rebuilt when the player comes back to them.
+    """
+
+    def __init__(self, mode_names: Iterable[str] = ()) -> None:
+        """This will initialize this class."""
+        self.__mode_names: List[str] = list(mode_names)
+        self.__mode_classes: Dict[str, Type[BaseModeClass]] = {}
+        self.__suspended: Dict[str, BaseModeClass] = {}
+
+    def resolve(self, mode_name: str) -> Type[BaseModeClass]:
+        """This will return the ModeClass of the mode, importing it only once."""
+        mode_class: Optional[Type[BaseModeClass]] = self.__mode_classes.get(mode_name)
+        if mode_class is None:
+            try:
+                module = import_module(f"tetr_cli.tetr_modules.modes.{mode_name}_mode")
+            except ModuleNotFoundError as exc:
+                raise ValueError(f'"{mode_name}" mode is not accessible!') from exc
+            mode_class = module.ModeClass
+            self.__mode_classes[mode_name] = mode_class
+        return mode_class
+
+    def warm(self) -> None:
+        """This will resolve every known mode, skipping the ones that do not exist yet."""
+        for mode_name in self.__mode_names:
+            try:
+                self.resolve(mode_name)
+            except ValueError:
+                continue
+
+    def start_warming(self) -> Thread:
+        """This will resolve every known mode in a background thread."""
+        thread: Thread = Thread(target=self.warm, name="mode_warmer", daemon=True)
+        thread.start()
+        return thread
+
+    def create(
+        self, mode_name: str, context: Optional[ModeContext] = None
+    ) -> BaseModeClass:
+        """This will resume the suspended instance of the mode, or build a new one."""
+        instance: Optional[BaseModeClass] = self.__suspended.pop(mode_name, None)
+        if instance is not None:
+            instance.resume(context)
+            return instance
+        return self.resolve(mode_name)(context=context)
+
+    def suspend(self, mode_name: str, instance: BaseModeClass) -> None:
+        """This will keep the instance for later, if its mode allows it."""
+        if instance.suspendable:
+            self.__suspended[mode_name] = instance
+
+    def clear_suspended(self) -> None:
+        """This will drop every suspended instance."""
+        self.__suspended.clear()
+
 
 class GameMode:
     """This will take care current game mode."""
 
-    def __init__(self) -> None:
-        self.__mode_instance = None
+    def __init__(
+        self,
+        recorder: Optional[ReplayRecorder] = None,
+        registry: Optional[ModeRegistry] = None,
+    ) -> None:
+        self.__mode_instance: Optional[BaseModeClass] = None
         self.__mode_name: str = "main_menu"
+        self.__recorder: Optional[ReplayRecorder] = recorder
+        self.__registry: ModeRegistry = registry if registry is not None else ModeRegistry()
+
+        # Time taken by change_mode, in microseconds
+        self.transition_latency: LatencyHistogram = LatencyHistogram()
+        self.last_transition_time: int = 0
 
     def get_current_mode_name(self) -> str:
         """This will get the current mode name."""
@@ -39,16 +116,51 @@ class GameMode:
         """This will increment frame based on the current mode."""
         if self.__mode_instance is None:
             raise RuntimeError("Mode not loaded.")
-        return self.__mode_instance.increment_frame(stdscr, pressed_keys)
+        result = self.__mode_instance.increment_frame(stdscr, pressed_keys)
+        if (
+            self.__recorder is not None
+            and self.__recorder.recording
+            and isinstance(self.__mode_instance, SoloBaseMode)
+            and self.__mode_instance.game.game_over
+        ):
+            self.__recorder.stop()
+        return result
+
+    def catch_up(self, pressed_keys: Set[str]) -> None:
+        """This will run one logic tick of the current mode without drawing."""
+        if self.__mode_instance is None:
+            raise RuntimeError("Mode not loaded.")
+        self.__mode_instance.catch_up(pressed_keys)
+
+    def invalidate_draw_cache(self) -> None:
+        """This will make the current mode redraw everything, after the screen was cleared."""
+        if self.__mode_instance is None:
+            raise RuntimeError("Mode not loaded.")
+        self.__mode_instance.invalidate_draw_cache()
 
     def change_mode(self, new_mode_name: str) -> None:
         """This will transition to new mode."""
+        start_time: float = perf_counter()
+        self.stop_recording()
+        handoff: Optional[ModeContext] = (
+            self.__mode_instance.handoff if self.__mode_instance is not None else None
+        )
+        new_instance: BaseModeClass = self.__registry.create(new_mode_name, handoff)
+        if self.__mode_instance is not None:
+            self.__registry.suspend(self.__mode_name, self.__mode_instance)
         self.__mode_name = new_mode_name
-        try:
-            module = import_module(f"tetr_cli.tetr_modules.modes.{self.__mode_name}_mode")
-            self.__mode_instance = module.ModeClass()
-        except ModuleNotFoundError as exc:
-            raise ValueError(f'"{self.__mode_name}" mode is not accessible!') from exc
+        self.__mode_instance = new_instance
+        if self.__recorder is not None and isinstance(self.__mode_instance, SoloBaseMode):
+            self.__recorder.start(
+                self.__mode_instance.game, self.__mode_name.rsplit(".", 1)[-1]
+            )
+        self.last_transition_time = int((perf_counter() - start_time) * 1_000_000)
+        self.transition_latency.record(self.last_transition_time)
+
+    def stop_recording(self) -> None:
+        """This will save the replay of the game being recorded, if any."""
+        if self.__recorder is not None:
+            self.__recorder.stop()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
 """This will handle the menu screen."""
 # coding: utf-8
 
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 from curses import window
 
 from tetr_cli.tetr_modules.menu_core.menu_mode import VerticalMenuModeClass
+from tetr_cli.tetr_modules.modules.mode_context import ModeContext
 
 
 OPTION_TO_ACTION: Dict[str, Dict[str, str]] = {
@@ -22,9 +23,9 @@ OPTION_LIST: List[str] = ["Solo", "Multiplayer", "Options", "Quit"]
 class ModeClass(VerticalMenuModeClass):
     """This will handle main_menu."""
 
-    def __init__(self) -> None:
+    def __init__(self, context: Optional[ModeContext] = None) -> None:
         """This will initialize this class."""
-        super().__init__(OPTION_LIST, OPTION_TO_ACTION)
+        super().__init__(OPTION_LIST, OPTION_TO_ACTION, context)
 
     def increment_frame(self, stdscr: window, pressed_keys: Set[str]) -> None:
         """This will progress the menu based on the inputs."""
@@ -4,12 +4,13 @@
 
 from curses import window, A_BOLD
 from datetime import datetime
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 
 from tetr_cli.tetr_modules.menu_core.base_mode import BaseModeClass
 
 from tetr_cli.tetr_modules.modules.constants import VALID_CHARS
-from tetr_cli.tetr_modules.modules.database import get_scores, set_scores, get_temp
+from tetr_cli.tetr_modules.modules.database import get_scores, set_scores
+from tetr_cli.tetr_modules.modules.mode_context import ModeContext
 from tetr_cli.tetr_modules.modules.safe_curses import (
     calculate_centered_menu,
     safe_addstr,
@@ -19,9 +20,9 @@ from tetr_cli.tetr_modules.modules.safe_curses import (
 class ModeClass(BaseModeClass):
     """This will handle score screen mode."""
 
-    def __init__(self) -> None:
+    def __init__(self, context: Optional[ModeContext] = None) -> None:
         """This will initialize this class."""
-        super().__init__()
+        super().__init__(context)
         self.game_over: bool = False
 
         self.user_name: str = ""
@@ -33,12 +34,11 @@ class ModeClass(BaseModeClass):
         self.cursor_blink: int = 0
         self.cursor_visible: bool = True
 
-        self.score_temp: str = get_temp("score") or "-1"
         self.score_list: List[Tuple[str, int, str]] = []
-        if self.score_temp != "-1":
+        if self.context.score is not None:
             self.game_over = True
-        self.score: int = int(self.score_temp)
-        self.score_type: str = get_temp("score_type") or "Marathon"
+        self.score: int = self.context.score if self.context.score is not None else -1
+        self.score_type: str = self.context.score_type
 
     def get_high_score(self) -> None:
         """This will return the high score."""
@@ -6,26 +6,25 @@ from curses import window, A_BOLD
 from typing import Optional, List, Set, Tuple
 
 from tetr_cli.tetr_modules.solo_core.base import SoloBaseMode
-from tetr_cli.tetr_modules.solo_core.mino import Mino
 from tetr_cli.tetr_modules.modules.constants import (
     MIN_X,
     MIN_Y,
     DRAW_BOARD_HEIGHT,
     DRAW_BOARD_WIDTH,
 )
-from tetr_cli.tetr_modules.modules.database import set_temp
+from tetr_cli.tetr_modules.modules.keybinds import MENU_BACK, MENU_CONFIRM, RESTART
+from tetr_cli.tetr_modules.modules.mode_context import ModeContext
 from tetr_cli.tetr_modules.modules.safe_curses import safe_addstr
 
 
 class ModeClass(SoloBaseMode):
     """This will handle the solo game mode."""
 
-    def __init__(self) -> None:
+    def __init__(self, context: Optional[ModeContext] = None) -> None:
         """This will initialize this class."""
-        super().__init__()
+        super().__init__(context)
         # For countdown: 3 seconds countdown
         # For animation: 0.5 second animation
-        self.mino_list_generator(initial=True)
         self.counter: int = self.fps_limit * 3  # Formally countdown
         self.mode: str = "countdown"
 
@@ -37,19 +36,19 @@ class ModeClass(SoloBaseMode):
             stdscr,
             self.offset[0] + DRAW_BOARD_HEIGHT - 2,
             self.offset[1] + DRAW_BOARD_WIDTH + 2,
-            f"Level: {self.level}",
+            f"Level: {self.game.level}",
         )
         safe_addstr(
             stdscr,
             self.offset[0] + DRAW_BOARD_HEIGHT - 1,
             self.offset[1] + DRAW_BOARD_WIDTH + 2,
-            f"Lines: {self.lines_cleared}",
+            f"Lines: {self.game.lines_cleared}",
         )
         safe_addstr(
             stdscr,
             self.offset[0] + DRAW_BOARD_HEIGHT,
             self.offset[1] + DRAW_BOARD_WIDTH + 2,
-            f"Score: {self.score}",
+            f"Score: {self.game.score}",
         )
         # Debug info
         # safe_addstr(
@@ -97,26 +96,17 @@ class ModeClass(SoloBaseMode):
         if self.counter == 0:
             self.clear_action_text(stdscr)
 
-    def check_game_over(self) -> bool:
-        """This will check if the game is over."""
-        if self.current_mino and not self.is_position_valid(
-            self.current_mino.get_block_positions()
-        ):
-            return True
-        return False
-
     def display_game_over(self, stdscr: window) -> None:
         """This will display game over text."""
         center_y: int = self.max_yx[0] // 2
         center_x: int = self.max_yx[1] // 2
-        self.board.draw_minos_on_board(
+        current_mino = self.game.current_mino
+        self.game.board.draw_minos_on_board(
             stdscr=stdscr,
             offset=self.offset,
             max_yx=self.max_yx,
-            current_mino=self.current_mino,
-            ghost_position=(
-                self.current_mino.position if self.current_mino else (-1, -1)
-            ),
+            current_mino=current_mino,
+            ghost_position=current_mino.position if current_mino else (-1, -1),
         )
         safe_addstr(
             stdscr,
@@ -140,81 +130,35 @@ class ModeClass(SoloBaseMode):
             A_BOLD,
         )
 
-    def play_mode(self, stdscr: window, pressed_keys: Set[str]) -> None:
+    def play_mode(self, stdscr: window, actions: int) -> None:
         """This will play the mode."""
-        if len(self.mino_list) <= 14:
-            self.mino_list_generator()
-        if not self.current_mino:
-            new_mino_type: str = self.mino_list.pop(0)
-            self.current_mino = Mino(
-                mino_type=new_mino_type, level=self.level, fps_limit=self.fps_limit
-            )
-            if self.check_game_over():
-                self.mode = "game_over"
-                self.display_game_over(stdscr)
-                self.sound_action["BGM"] = ["stop"]
-                return
-
-        self.check_keyinput_pressed(pressed_keys=pressed_keys)
-        if not self.current_mino:
-            self.board.draw_minos_on_board(
-                stdscr=stdscr,
-                offset=self.offset,
-                max_yx=self.max_yx,
-                current_mino=self.current_mino,
-                ghost_position=(-1, -1),  # Placeholder value
-            )
+        self.step_game(actions)
+        if self.game.game_over:
+            self.mode = "game_over"
+            self.display_game_over(stdscr)
+            self.sound_action["BGM"] = ["stop"]
+            return
 
-        if self.mino_touching_bottom(self.current_mino):
-            # print(self.current_mino.type, self.current_mino.lock_info)
-            if (
-                self.current_mino.position[0]
-                < self.current_mino.lock_info["lock_height"]
-            ):
-                self.current_mino.lock_info["lock_height"] = self.current_mino.position[
-                    0
-                ]
-                self.current_mino.lock_info["lock_count"] = 15
-            elif (
-                pressed_keys
-                and not pressed_keys & {"down", "space"}
-                and self.current_mino.lock_info["lock_count"] > 0
-            ):
-                self.current_mino.lock_info["lock_count"] -= 1
-                self.current_mino.lock_info["lock_delay"] = int(0.5 * self.fps_limit)
-            elif self.current_mino.lock_info["lock_delay"] > 0:
-                self.current_mino.lock_info["lock_delay"] -= 1
-            else:
-                self.board.place_mino(
-                    self.current_mino.type,
-                    self.current_mino.orientation,
-                    self.current_mino.position,
-                )
-                self.calculate_score()
-                self.reset_mino()
-
-        if self.current_mino:
-            if self.current_mino.fall_delay > 0:
-                self.current_mino.fall_delay -= 1
-            elif not self.mino_touching_bottom(self.current_mino) and not (
-                pressed_keys & {"down", "space"}
-            ):
-                self.current_mino.move_down(is_position_valid=self.is_position_valid)
-                self.current_mino.fall_delay = self.current_mino.reset_fall_delay(
-                    self.level
-                )
+        self.draw_board(stdscr)
+        self.display_action_text(stdscr)
 
-        self.board.draw_minos_on_board(
+    def draw_board(self, stdscr: window) -> None:
+        """This will draw the board with the current and ghost mino."""
+        self.game.board.draw_minos_on_board(
             stdscr=stdscr,
             offset=self.offset,
             max_yx=self.max_yx,
-            current_mino=self.current_mino,
-            ghost_position=self.ghost_mino_position(self.current_mino),
+            current_mino=self.game.current_mino,
+            ghost_position=self.game.ghost_mino_position(self.game.current_mino),
         )
-        self.display_action_text(stdscr)
 
     def countdown_mode(self, stdscr: window) -> None:
         """This will handle the countdown mode."""
+        self.game.board.draw_minos_on_board(
+            stdscr=stdscr,
+            offset=self.offset,
+            max_yx=self.max_yx,
+        )
         if self.counter >= 0:
             safe_addstr(
                 stdscr,
@@ -235,6 +179,11 @@ class ModeClass(SoloBaseMode):
             safe_addstr(stdscr, self.max_yx[0] // 2, self.max_yx[1] // 2, "Go", A_BOLD)
             self.counter = self.fps_limit // 2
 
+    def catch_up(self, pressed_keys: Set[str]) -> None:
+        """This will step the game without drawing, when the main loop is behind."""
+        if self.mode in ("play", "play_music_wait") and not self.game.game_over:
+            self.step_game(self.get_action_mask(pressed_keys))
+
     def increment_frame(self, stdscr: window, pressed_keys: Set[str]) -> None:
         """This will increment the frame."""
         check_max_yx: Tuple[int, int] = stdscr.getmaxyx()
@@ -249,49 +198,60 @@ class ModeClass(SoloBaseMode):
         if check_max_yx[0] < MIN_Y or check_max_yx[1] < MIN_X:
             return
 
+        actions: int = self.get_action_mask(pressed_keys)
         if self.mode == "game_over":
-            if self.get_user_keybind("menu_confirm", menu_mode=True) & pressed_keys:
+            if actions & MENU_CONFIRM:
                 self.action["transition"] = ["Score_Screen"]
-                set_temp("score", str(self.score))
-                set_temp("score_type", "Marathon")
+                self.handoff = ModeContext(score=self.game.score, score_type="Marathon")
                 self.sound_action["SFX"].append("select_confirm")
                 return
             self.display_game_over(stdscr)
             return
 
-        queue_to_draw: List[str] = self.mino_list[0:5]
-        hold_to_draw: Optional[str] = (
-            self.current_hold.type if self.current_hold else None
+        queue_to_draw: List[str] = self.game.mino_list[0:5]
+        hold_to_draw: Tuple[Optional[str], bool] = (
+            self.game.current_hold.type if self.game.current_hold else None,
+            self.game.hold_used,
         )
 
-        self.board.draw_blank_board(stdscr, self.offset)
-        self.show_stats(stdscr)
-        self.board.add_title(stdscr, self.offset, "Marathon")
+        if not self._chrome_drawn:
+            self.game.board.draw_blank_board(stdscr, self.offset)
+            self.game.board.add_title(stdscr, self.offset, "Marathon")
+            self._chrome_drawn = True
+
+        stats_to_draw: Tuple[int, ...] = (
+            self.game.level,
+            self.game.lines_cleared,
+            self.game.score,
+        )
+        if stats_to_draw != self._last_drawn_stats:
+            self.show_stats(stdscr)
+            self._last_drawn_stats = stats_to_draw
 
         if queue_to_draw != self._last_drawn_queue:
-            self.board.draw_queue(
+            self.game.board.draw_queue(
                 stdscr,
                 offset=self.offset,
                 max_yx=self.max_yx,
-                queue_list=self.mino_list[0:5],
+                queue_list=queue_to_draw,
             )
-            self._last_drawn_queue = queue_to_draw.copy()
+            self._last_drawn_queue = queue_to_draw
 
         if hold_to_draw != self._last_drawn_hold:
-            self.board.draw_hold(
+            self.game.board.draw_hold(
                 stdscr,
                 offset=self.offset,
                 max_yx=self.max_yx,
-                hold_used=self.hold_used,
-                hold_mino=self.current_hold,
+                hold_used=self.game.hold_used,
+                hold_mino=self.game.current_hold,
             )
             self._last_drawn_hold = hold_to_draw
 
-        if self.get_user_keybind("restart") & pressed_keys:
+        if actions & RESTART:
             self.action["transition"] = ["Marathon"]
             self.sound_action["SFX"].append("select_confirm")
             return
-        if self.get_user_keybind("menu_back", menu_mode=True) & pressed_keys:
+        if actions & MENU_BACK:
             self.action["transition"] = ["Solo_Menu"]
             self.sound_action["SFX"].append("select_back")
             return
@@ -300,13 +260,16 @@ class ModeClass(SoloBaseMode):
             self.countdown_mode(stdscr)
             return
 
-        self.play_mode(stdscr, pressed_keys)
+        self.play_mode(stdscr, actions)
 
         if self.mode == "play_music_wait":
             self.counter -= 1
             if self.counter <= 0:
                 self.mode = "play"
                 self.sound_action["BGM"] = ["Korobeiniki"]
+                # Redraw the whole board to erase the "Go" text
+                self.game.board.invalidate_frame()
+                self.draw_board(stdscr)
                 return
             safe_addstr(
                 stdscr,
@@ -8,9 +8,21 @@ from typing import Set, Dict, List, Tuple
 MIN_X: int = 80
 MIN_Y: int = 24
 
+# Most logic ticks run without drawing when the main loop falls behind
+MAX_CATCH_UP_TICKS: int = 5
+
+# Curses only sends key presses, repeated while held (seconds, see KeyRepeatModel)
+KEY_REPEAT_DELAY: float = 0.6
+KEY_REPEAT_INTERVAL: float = 0.08
+# Most key events read from curses in one frame
+MAX_KEY_EVENTS: int = 64
+
 BOARD_WIDTH: int = 10
 BOARD_HEIGHT: int = 40
 
+# Row bitmask with every column filled (bit x is column x)
+FULL_ROW_MASK: int = (1 << BOARD_WIDTH) - 1
+
 
 # (y, x), A B C D
 T_SPIN_CORNER_CHECKS: Dict[str, List[Tuple[int, int]]] = {
@@ -23,6 +35,35 @@ T_SPIN_CORNER_CHECKS: Dict[str, List[Tuple[int, int]]] = {
 DRAW_BOARD_WIDTH: int = BOARD_WIDTH * 2  # Each cell is 2 chars wide
 DRAW_BOARD_HEIGHT: int = 20  # Show only 22 rows 20 + 2 for extra
 
+# Keybind names that drive the game itself (restart and menu keys are handled by modes)
+GAME_ACTIONS: Tuple[str, ...] = (
+    "move_left",
+    "move_right",
+    "rotate_cw",
+    "rotate_ccw",
+    "soft_drop",
+    "hard_drop",
+    "hold_piece",
+)
+# Keybind names handled by the modes themselves
+MODE_ACTIONS: Tuple[str, ...] = ("restart",)
+MENU_ACTIONS: Tuple[str, ...] = (
+    "menu_confirm",
+    "menu_back",
+    "menu_up",
+    "menu_down",
+    "menu_left",
+    "menu_right",
+)
+
+# Bit of each keybind name in an action mask. Game actions come first, so the
+# game part of a mask is also the bitmask stored in replays.
+ACTION_BITS: Dict[str, int] = {
+    action: 1 << index
+    for index, action in enumerate(GAME_ACTIONS + MODE_ACTIONS + MENU_ACTIONS)
+}
+GAME_ACTION_MASK: int = (1 << len(GAME_ACTIONS)) - 1
+
 MINO_TYPES: Set[str] = {"O", "I", "T", "L", "J", "S", "Z"}
 MINO_COLOR: Dict[str, int] = {"O": 1, "I": 2, "T": 3, "L": 4, "J": 5, "S": 6, "Z": 7}
 MINO_ORIENTATIONS: List[str] = ["N", "E", "S", "W"]
@@ -4,7 +4,9 @@
 
 from typing import Dict, Set, List, Optional, Tuple
 from pathlib import Path
-from sqlite3 import Cursor, Error as SQLiteError, connect
+from sqlite3 import Connection, Cursor, Error as SQLiteError, connect
+
+from tetr_cli.tetr_modules.modules.keybinds import KeybindTable
 
 
 DATABASE_PATH: Path = Path(__file__).parent.parent.resolve()
@@ -33,6 +35,11 @@ DEFAULT_SETTINGS: List[Tuple[str, str]] = [
     ("music_volume", "70"),
     ("sfx_volume", "80"),
     ("FPS_limit", "30"),
+    # Handling, see solo_core/timing.py
+    ("DAS_ms", "167"),
+    ("ARR_ms", "33"),
+    ("SDF", "20"),
+    ("lock_delay_ms", "500"),
 ]
 
 
@@ -115,6 +122,22 @@ def insert_default_settings(cursor: Cursor) -> None:
     )
 
 
+def insert_missing_settings(cursor: Cursor) -> None:
+    """Insert the default of every setting not in the setting table yet."""
+    cursor.execute("SELECT setting_name FROM settings")
+    existing_settings: Set[str] = {row[0] for row in cursor.fetchall()}
+    cursor.executemany(
+        """
+    INSERT INTO settings (setting_name, setting_value) VALUES (?, ?)
+    """,
+        [
+            (setting_name, setting_value)
+            for setting_name, setting_value in DEFAULT_SETTINGS
+            if setting_name not in existing_settings
+        ],
+    )
+
+
 # Keybinds Table Functions
 def drop_keybinds(cursor: Cursor) -> None:
     """Reset the keybind table."""
@@ -206,11 +229,144 @@ def reset_all(cursor: Cursor) -> None:
 #             create_temp_table(cursor)
 
 
+class SettingsStore:
+    """This will keep the settings and keybinds in memory for the whole process.
+
+    Everything is read once over a single long-lived connection. Reads are
+    served from memory, changes are written through to the database, and
+    invalidate() makes the next read load from the database again.
+    """
+
+    def __init__(self, db_file: str = DB_FILE) -> None:
+        """This will initialize this class."""
+        self.__db_file: str = db_file
+        self.__connection: Optional[Connection] = None
+        self.__settings: Optional[Dict[str, str]] = None
+        self.__keybinds: Optional[Dict[str, Dict[str, Set[str]]]] = None
+        self.__keybind_table: Optional[KeybindTable] = None
+
+    @property
+    def connection(self) -> Connection:
+        """This will return the shared connection, opening it on first use."""
+        if self.__connection is None:
+            self.__connection = connect(self.__db_file)
+        return self.__connection
+
+    def close(self) -> None:
+        """This will close the shared connection and drop the cache."""
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """This will make the next read load from the database again."""
+        self.__settings = None
+        self.__keybinds = None
+        self.__keybind_table = None
+
+    def __load_settings(self) -> Dict[str, str]:
+        """This will read every setting, falling back to the defaults."""
+        settings: Dict[str, str] = dict(DEFAULT_SETTINGS)
+        cursor: Cursor = self.connection.cursor()
+        cursor.execute("SELECT setting_name, setting_value FROM settings")
+        settings.update(cursor.fetchall())
+        return settings
+
+    def get_setting(self, setting_name: str) -> str:
+        """This will return a setting value from memory."""
+        if self.__settings is None:
+            self.__settings = self.__load_settings()
+        return self.__settings.get(setting_name, "0")
+
+    def set_setting(self, setting_name: str, setting_value: str) -> None:
+        """This will change a setting and write it through to the database."""
+        with self.connection as conn:
+            conn.execute(
+                """
+                UPDATE settings SET setting_value = ? WHERE setting_name = ?
+                """,
+                (setting_value, setting_name),
+            )
+        if self.__settings is not None:
+            self.__settings[setting_name] = setting_value
+
+    def load_keybinds(self) -> Dict[str, Dict[str, Set[str]]]:
+        """This will return the keybinds from memory. Do not modify the result."""
+        if self.__keybinds is None:
+            self.__keybinds = self.__load_keybinds()
+        return self.__keybinds
+
+    def load_keybind_table(self) -> KeybindTable:
+        """This will return the keybinds compiled into action bits."""
+        if self.__keybind_table is None:
+            self.__keybind_table = KeybindTable(self.load_keybinds())
+        return self.__keybind_table
+
+    def __load_keybinds(self) -> Dict[str, Dict[str, Set[str]]]:
+        """This will read the keybinds, resetting them if any of them conflict."""
+        cursor: Cursor = self.connection.cursor()
+        cursor.execute(
+            "SELECT input_name, is_menu_keybind, key_name1, key_name2 FROM keybinds"
+        )
+        rows: List[Tuple[str, bool, str, Optional[str]]] = cursor.fetchall()
+
+        menu_keybinds: Dict[str, Set[str]] = {}
+        game_keybinds: Dict[str, Set[str]] = {}
+
+        for input_name, is_menu_keybind, key_name1, key_name2 in rows:
+            target: Dict[str, Set[str]] = (
+                menu_keybinds if is_menu_keybind else game_keybinds
+            )
+            if input_name not in target:
+                target[input_name] = set()
+            target[input_name].add(key_name1)
+            if key_name2 is not None:
+                target[input_name].add(key_name2)
+
+        if not validate_keybinds(menu_keybinds) or not validate_keybinds(game_keybinds):
+            with self.connection as conn:
+                cursor = conn.cursor()
+                drop_keybinds(cursor)
+                create_keybinds_table(cursor)
+                insert_default_keybinds(cursor)
+            return self.__load_keybinds()
+
+        return {"menu_keys": menu_keybinds, "game_keys": game_keybinds}
+
+    def update_keybind(
+        self, key_name: str, key_value1: str, key_value2: Optional[str] = None
+    ) -> None:
+        """This will change a keybind in the database and drop the cached keybinds."""
+        with self.connection as conn:
+            if key_value2 is not None:
+                conn.execute(
+                    """
+                UPDATE keybinds SET key_name1 = ?, key_name2 = ? WHERE input_name = ?
+                """,
+                    (key_value1, key_value2, key_name),
+                )
+            else:
+                conn.execute(
+                    """
+                UPDATE keybinds SET key_name1 = ? WHERE input_name = ?
+                """,
+                    (key_value1, key_name),
+                )
+        self.__keybinds = None
+        self.__keybind_table = None
+
+
+# Process-wide store, shared by every mode
+settings_store: SettingsStore = SettingsStore()
+
+
 def initialize_database(reset: bool = False) -> None:
     """This will connect to the database and create the tables if they do not exist."""
+    settings_store.invalidate()
 
     try:
-        with connect(DB_FILE) as conn:
+        with settings_store.connection as conn:
             cursor: Cursor = conn.cursor()
 
             if reset:
@@ -231,9 +387,8 @@ def initialize_database(reset: bool = False) -> None:
             if cursor.fetchone()[0] == 0:
                 insert_default_keybinds(cursor)
 
-            cursor.execute("SELECT COUNT(*) FROM settings")
-            if cursor.fetchone()[0] == 0:
-                insert_default_settings(cursor)
+            # Settings added by newer versions get their defaults too
+            insert_missing_settings(cursor)
             conn.commit()
 
     except SQLiteError as e:
@@ -256,76 +411,25 @@ def validate_keybinds(
 
 
 def load_keybinds() -> Dict[str, Dict[str, Set[str]]]:
-    """Load user keybind from the database."""
-
-    rows: List[Tuple[str, bool, str, Optional[str]]] = []
-    with connect(DB_FILE) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT input_name, is_menu_keybind, key_name1, key_name2 FROM keybinds"
-        )
-        rows = cursor.fetchall()
-
-    user_keybinds: Dict[str, Dict[str, Set[str]]] = {}
-    menu_keybinds: Dict[str, Set[str]] = {}
-    game_keybinds: Dict[str, Set[str]] = {}
+    """Load user keybind from the settings store."""
+    return settings_store.load_keybinds()
 
-    for input_name, is_menu_keybind, key_name1, key_name2 in rows:
-        if is_menu_keybind:
-            if input_name not in menu_keybinds:
-                menu_keybinds[input_name] = set()
-            menu_keybinds[input_name].add(key_name1)
-            if key_name2 is not None:
-                menu_keybinds[input_name].add(key_name2)
-        else:
-            if input_name not in game_keybinds:
-                game_keybinds[input_name] = set()
-            game_keybinds[input_name].add(key_name1)
-            if key_name2 is not None:
-                game_keybinds[input_name].add(key_name2)
-
-    if not validate_keybinds(menu_keybinds) or not validate_keybinds(game_keybinds):
-        with connect(DB_FILE) as conn:
-            cursor = conn.cursor()
-            drop_keybinds(cursor)
-            create_keybinds_table(cursor)
-            insert_default_keybinds(cursor)
-        return load_keybinds()
 
-    user_keybinds["menu_keys"] = menu_keybinds
-    user_keybinds["game_keys"] = game_keybinds
-
-    return user_keybinds
+def load_keybind_table() -> KeybindTable:
+    """Load the user keybinds compiled into action bits."""
+    return settings_store.load_keybind_table()
 
 
 def update_keybind(
     key_name: str, key_value1: str, key_value2: Optional[str] = None
 ) -> None:
     """Update keybind in the database."""
-    with connect(DB_FILE) as conn:
-        cursor: Cursor = conn.cursor()
-
-        if key_value2 is not None:
-            cursor.execute(
-                """
-            UPDATE keybind SET key_value1 = ?, key_value2 = ? WHERE key_name = ?
-            """,
-                (key_value1, key_value2, key_name),
-            )
-        else:
-            cursor.execute(
-                """
-            UPDATE keybind SET key_value1 = ? WHERE key_name = ?
-            """,
-                (key_value1, key_name),
-            )
-
-        conn.commit()
+    settings_store.update_keybind(key_name, key_value1, key_value2)
 
 
 def get_scores(score_type: str) -> List[Tuple[str, int, str, str]]:
     """Retrieve scores from the database based on score type."""
-    with connect(DB_FILE) as conn:
+    with settings_store.connection as conn:
         cursor: Cursor = conn.cursor()
 
         cursor.execute(
@@ -347,7 +451,7 @@ def set_scores(
     game_type: str,
 ):
     """Set a score in the scores table."""
-    with connect(DB_FILE) as conn:
+    with settings_store.connection as conn:
         cursor: Cursor = conn.cursor()
 
         cursor.execute(
@@ -371,39 +475,18 @@ def set_scores(
 
 
 def get_setting(setting_name: str) -> str:
-    """Get a setting value from the settings table."""
-    with connect(DB_FILE) as conn:
-        cursor: Cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT setting_value FROM settings WHERE setting_name = ?
-            """,
-            (setting_name,),
-        )
-        result = cursor.fetchone()
-
-    return result[0] if result else "0"
+    """Get a setting value from the settings store."""
+    return settings_store.get_setting(setting_name)
 
 
 def set_setting(setting_name: str, setting_value: str) -> None:
     """Set a setting value in the settings table."""
-    with connect(DB_FILE) as conn:
-        cursor: Cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE settings SET setting_value = ? WHERE setting_name = ?
-            """,
-            (setting_value, setting_name),
-        )
-
-        conn.commit()
+    settings_store.set_setting(setting_name, setting_value)
 
 
 def set_temp(key: str, value: str) -> None:
     """Set a temporary value in the temps table."""
-    with connect(DB_FILE) as conn:
+    with settings_store.connection as conn:
         cursor: Cursor = conn.cursor()
 
         check_query = "SELECT COUNT(*) FROM temps WHERE temp_name = ?"
@@ -428,7 +511,7 @@ def set_temp(key: str, value: str) -> None:
 
 def get_temp(key: str) -> str:
     """Get a temporary value from the temps table."""
-    with connect(DB_FILE) as conn:
+    with settings_store.connection as conn:
         cursor: Cursor = conn.cursor()
 
         cursor.execute(
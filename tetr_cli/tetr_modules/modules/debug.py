@@ -2,11 +2,195 @@
 
 # coding: utf-8
 
+from json import dump
+from pathlib import Path
 from time import perf_counter
-from typing import Set
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from curses import window, error as curses_error
 
+from tetr_cli.tetr_modules.modules.safe_curses import pop_curses_call_count
+
+if TYPE_CHECKING:
+    from tetr_cli.tetr_modules.modules.scheduler import FrameScheduler
+
+
+PROFILE_FILE: Path = Path(__file__).parent.parent.resolve() / "frame_profile.json"
+
+# Returns a summary per entry, like the load time and size of each audio asset
+ReportFunction = Callable[[], Dict[str, Dict[str, Union[int, float]]]]
+
+# Phases of one main loop iteration, in the order they run
+PROFILE_PHASES: Tuple[str, ...] = (
+    "sleep",
+    "getch",
+    "debug",
+    "increment_frame",
+    "flush",
+    "doupdate",
+    "play_sounds",
+    "actions",
+)
+
+
+class LatencyHistogram:
+    """Log-linear histogram of non-negative ints, in the style of HdrHistogram.
+
+    Values below 2 * SUB_BUCKETS are exact, larger ones keep 5 significant bits
+    (about 3% error), so the memory stays small for any range.
+    """
+
+    SUB_BUCKETS: int = 32
+
+    def __init__(self) -> None:
+        """Initializes the variables."""
+        self.__counts: List[int] = []
+        self.count: int = 0
+        self.total: int = 0
+        self.max: int = 0
+
+    def __bucket_index(self, value: int) -> int:
+        """Returns the bucket of the value."""
+        if value < 2 * self.SUB_BUCKETS:
+            return value
+        exponent: int = value.bit_length() - 6
+        return exponent * self.SUB_BUCKETS + (value >> exponent)
+
+    def __bucket_value(self, index: int) -> int:
+        """Returns the highest value that falls in the bucket."""
+        if index < 2 * self.SUB_BUCKETS:
+            return index
+        exponent: int = index // self.SUB_BUCKETS - 1
+        mantissa: int = index % self.SUB_BUCKETS + self.SUB_BUCKETS
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, value: int) -> None:
+        """Records one value."""
+        value = max(0, value)
+        index: int = self.__bucket_index(value)
+        if index >= len(self.__counts):
+            self.__counts.extend([0] * (index + 1 - len(self.__counts)))
+        self.__counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percent: float) -> int:
+        """Returns the value at or below which the given percent of values fall."""
+        if self.count == 0:
+            return 0
+        threshold: float = self.count * percent / 100
+        seen: int = 0
+        for index, bucket_count in enumerate(self.__counts):
+            seen += bucket_count
+            if bucket_count and seen >= threshold:
+                return min(self.__bucket_value(index), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        """Returns the summary of the histogram."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class FrameProfiler:
+    """Times every phase of the main loop and counts curses writes per frame."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        """Initializes the variables."""
+        self.enabled: bool = enabled
+        # Durations are in microseconds
+        self.phases: Dict[str, LatencyHistogram] = {
+            phase: LatencyHistogram() for phase in PROFILE_PHASES
+        }
+        self.frame: LatencyHistogram = LatencyHistogram()
+        self.curses_calls: LatencyHistogram = LatencyHistogram()
+        self.last_curses_calls: int = 0
+        # Histograms kept by other parts of the loop, added to the JSON dump
+        self.__watched: Dict[str, LatencyHistogram] = {}
+        self.__reports: Dict[str, ReportFunction] = {}
+        self.__frame_start: float = perf_counter()
+        self.__last_mark: float = self.__frame_start
+
+    def watch(self, name: str, histogram: LatencyHistogram) -> None:
+        """Adds a histogram kept elsewhere to the JSON dump."""
+        self.__watched[name] = histogram
+
+    def add_report(self, prefix: str, report: ReportFunction) -> None:
+        """Adds the entries of a report to the JSON dump, named prefix.entry."""
+        self.__reports[prefix] = report
+
+    def start_frame(self) -> None:
+        """Starts timing a new main loop iteration."""
+        if not self.enabled:
+            return
+        self.__frame_start = perf_counter()
+        self.__last_mark = self.__frame_start
+
+    def mark(self, phase: str) -> None:
+        """Records the time since the last mark as the given phase."""
+        if not self.enabled:
+            return
+        now: float = perf_counter()
+        self.phases[phase].record(int((now - self.__last_mark) * 1_000_000))
+        self.__last_mark = now
+
+    def end_frame(self) -> None:
+        """Records the whole iteration and the curses writes done in it."""
+        if not self.enabled:
+            return
+        self.frame.record(int((perf_counter() - self.__frame_start) * 1_000_000))
+        self.last_curses_calls = pop_curses_call_count()
+        self.curses_calls.record(self.last_curses_calls)
+
+    def summary_lines(self) -> List[str]:
+        """Returns the p50/p99/max of each phase as short lines for the overlay."""
+        entries: List[str] = [
+            f"{phase} {histogram.percentile(50)}/{histogram.percentile(99)}/{histogram.max}"
+            for phase, histogram in self.phases.items()
+        ]
+        half: int = (len(entries) + 1) // 2
+        return [
+            "us p50/p99/max: " + ", ".join(entries[:half]),
+            "  " + ", ".join(entries[half:])
+            + f", frame {self.frame.percentile(50)}/{self.frame.percentile(99)}"
+            + f"/{self.frame.max}, calls {self.last_curses_calls}",
+        ]
+
+    def to_dict(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Returns every histogram summary."""
+        summary: Dict[str, Dict[str, Union[int, float]]] = {
+            phase: histogram.to_dict() for phase, histogram in self.phases.items()
+        }
+        summary["frame"] = self.frame.to_dict()
+        summary["curses_calls"] = self.curses_calls.to_dict()
+        for name, histogram in self.__watched.items():
+            summary[name] = histogram.to_dict()
+        for prefix, report in self.__reports.items():
+            for name, entry in report().items():
+                summary[f"{prefix}.{name}"] = entry
+        return summary
+
+    def dump_json(self, path: Path = PROFILE_FILE) -> Optional[Path]:
+        """Writes every histogram summary to a JSON file, and returns its path.
+
+        Called on shutdown, so a path that cannot be written (a read-only
+        install) returns None instead of raising over the original error.
+        """
+        if not self.enabled:
+            return None
+        try:
+            with open(path, "w", encoding="utf-8") as profile_file:
+                dump(self.to_dict(), profile_file, indent=4)
+        except OSError:
+            return None
+        return path
+
 
 class DebugClass:
     """The debug class. Holds lots of information related to debug."""
@@ -19,21 +203,28 @@ class DebugClass:
         self.start_time: float = perf_counter()
         self.keypress: Set[str] = set()
         self.mode: str = "main_menu"
+        self.transition_time: int = 0
         return
 
     def update_keypress(self, keypress: Set[str]) -> None:
         """Updates the keypress in the debug class."""
         self.keypress = keypress
 
-    def update_current_mode(self, new_mode: str) -> None:
-        """Updates the new mode onto this class."""
+    def update_current_mode(self, new_mode: str, transition_time: int = 0) -> None:
+        """Updates the new mode and how long switching to it took (in us)."""
         self.mode = new_mode
+        self.transition_time = transition_time
 
     def __keypress_set_to_string(self) -> str:
         """Converts keypress set to string."""
         return ", ".join(str(key) for key in self.keypress)
 
-    def update_debug(self, stdscr) -> window:
+    def update_debug(
+        self,
+        stdscr,
+        profiler: Optional[FrameProfiler] = None,
+        scheduler: Optional["FrameScheduler"] = None,
+    ) -> window:
         """Update debug info on screen and manage frame rate calculation."""
         self.frame_count += 1
         self.total_frame_count += 1
@@ -46,13 +237,33 @@ class DebugClass:
             self.start_time = current_time
 
         max_y, max_x = stdscr.getmaxyx()
+        if profiler is not None and profiler.enabled:
+            for line_number, line in enumerate(profiler.summary_lines()):
+                if max_y > 4 - line_number:
+                    try:
+                        stdscr.addstr(
+                            max_y - 4 + line_number,
+                            0,
+                            line[:(max_x - 1)].ljust(max_x - 1),
+                        )
+                    except curses_error:
+                        pass
+
         if max_y > 2:
-            stdscr.addstr(
-                max_y - 2,
-                0,
-                (f"Current mode: {self.mode} Total frames: {self.total_frame_count}")
-                + (f", Frame rate: {self.frame_rate:.2f}"),
+            status_line: str = (
+                (f"Current mode: {self.mode} ({self.transition_time}us)")
+                + (f" Total frames: {self.total_frame_count}")
+                + (f", Frame rate: {self.frame_rate:.2f}")
             )
+            if scheduler is not None:
+                status_line += (
+                    f", Tick jitter p99: {scheduler.jitter.percentile(99)}us"
+                    f" Dropped: {scheduler.dropped_ticks}"
+                )
+            try:
+                stdscr.addstr(max_y - 2, 0, status_line[:(max_x - 1)])
+            except curses_error:
+                pass
 
         if max_y > 1:
             the_string: str = f"Current keys: {self.__keypress_set_to_string()} "
@@ -0,0 +1,117 @@
+"""This will stand in for a curses window, so renderers can run without a terminal."""
+
+# coding: utf-8
+
+from collections import Counter, deque
+from curses import error as curses_error
+from typing import Counter as CounterType, Deque, Iterable, List, Tuple
+
+
+class FakeWindow:
+    """This will keep every cell in memory and count the calls made to it.
+
+    addstr behaves like curses: text wraps at the right edge, and writing
+    outside the window, or past the bottom right cell, raises curses.error
+    after the cells that fit are written.
+    """
+
+    def __init__(self, max_y: int = 30, max_x: int = 100) -> None:
+        """This will initialize this class."""
+        self.max_y: int = max_y
+        self.max_x: int = max_x
+        # [y][x] -> (character, attribute)
+        self.cells: List[List[Tuple[str, int]]] = []
+        self.calls: CounterType[str] = Counter()
+        self.cursor: Tuple[int, int] = (0, 0)
+        self.__keys: Deque[int] = deque()
+        self.clear()
+
+    def resize(self, max_y: int, max_x: int) -> None:
+        """This will change the window size and blank it, like a terminal resize."""
+        self.max_y = max_y
+        self.max_x = max_x
+        self.clear()
+
+    def reset_calls(self) -> None:
+        """This will reset the call counts."""
+        self.calls.clear()
+
+    def push_keys(self, keys: Iterable[int]) -> None:
+        """This will queue key codes to be returned by getch."""
+        self.__keys.extend(keys)
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        """This will return the window size."""
+        self.calls["getmaxyx"] += 1
+        return self.max_y, self.max_x
+
+    def addstr(self, y: int, x: int, string: str, attr: int = 0) -> None:
+        """This will write the string into the cells."""
+        self.calls["addstr"] += 1
+        if not (0 <= y < self.max_y and 0 <= x < self.max_x):
+            raise curses_error("addstr() returned ERR")
+        for character in string:
+            if character == "\n":
+                y, x = y + 1, 0
+            else:
+                self.cells[y][x] = (character, attr)
+                x += 1
+                if x == self.max_x:
+                    y, x = y + 1, 0
+            if y == self.max_y:
+                self.cursor = (self.max_y - 1, self.max_x - 1)
+                raise curses_error("addstr() returned ERR")
+        self.cursor = (y, x)
+
+    def move(self, y: int, x: int) -> None:
+        """This will move the cursor."""
+        self.calls["move"] += 1
+        if not (0 <= y < self.max_y and 0 <= x < self.max_x):
+            raise curses_error("wmove() returned ERR")
+        self.cursor = (y, x)
+
+    def clrtoeol(self) -> None:
+        """This will blank the cursor line from the cursor to the right edge."""
+        self.calls["clrtoeol"] += 1
+        y, x = self.cursor
+        self.cells[y][x:] = [(" ", 0)] * (self.max_x - x)
+
+    def clear(self) -> None:
+        """This will blank every cell."""
+        self.calls["clear"] += 1
+        self.cells = [[(" ", 0)] * self.max_x for _ in range(self.max_y)]
+
+    def erase(self) -> None:
+        """This will blank every cell."""
+        self.clear()
+
+    def getch(self) -> int:
+        """This will return the next queued key, or -1 like a nodelay window."""
+        self.calls["getch"] += 1
+        return self.__keys.popleft() if self.__keys else -1
+
+    def keypad(self, flag: bool) -> None:
+        """This will do nothing, as there is no terminal."""
+
+    def nodelay(self, flag: bool) -> None:
+        """This will do nothing, as there is no terminal."""
+
+    def noutrefresh(self) -> None:
+        """This will count the refresh, there is no terminal to update."""
+        self.calls["noutrefresh"] += 1
+
+    def refresh(self) -> None:
+        """This will count the refresh, there is no terminal to update."""
+        self.calls["refresh"] += 1
+
+    def row_text(self, y: int) -> str:
+        """This will return the characters of one row."""
+        return "".join(character for character, _ in self.cells[y])
+
+    def dump(self) -> str:
+        """This will return the characters of every row, one line each."""
+        return "\n".join(self.row_text(y) for y in range(self.max_y))
+
+
+if __name__ == "__main__":
+    print("This module is not meant to be run directly.")
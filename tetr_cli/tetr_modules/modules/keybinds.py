@@ -0,0 +1,54 @@
+"""This will turn pressed keys into a bitmask of the actions they are bound to."""
+
+# coding: utf-8
+
+from typing import Dict, Iterable, Set
+
+from tetr_cli.tetr_modules.modules.constants import ACTION_BITS
+
+
+# Bit of each action, to test against an action mask
+MOVE_LEFT: int = ACTION_BITS["move_left"]
+MOVE_RIGHT: int = ACTION_BITS["move_right"]
+ROTATE_CW: int = ACTION_BITS["rotate_cw"]
+ROTATE_CCW: int = ACTION_BITS["rotate_ccw"]
+SOFT_DROP: int = ACTION_BITS["soft_drop"]
+HARD_DROP: int = ACTION_BITS["hard_drop"]
+HOLD_PIECE: int = ACTION_BITS["hold_piece"]
+RESTART: int = ACTION_BITS["restart"]
+MENU_CONFIRM: int = ACTION_BITS["menu_confirm"]
+MENU_BACK: int = ACTION_BITS["menu_back"]
+MENU_UP: int = ACTION_BITS["menu_up"]
+MENU_DOWN: int = ACTION_BITS["menu_down"]
+MENU_LEFT: int = ACTION_BITS["menu_left"]
+MENU_RIGHT: int = ACTION_BITS["menu_right"]
+
+
+class KeybindTable:
+    """This will hold the action bits of every bound key.
+
+    It is built once from the keybinds, so a frame's pressed keys become one
+    int with a dict lookup per key, and modes test bits instead of sets.
+    """
+
+    def __init__(self, keybinds: Dict[str, Dict[str, Set[str]]]) -> None:
+        """This will initialize this class."""
+        # Key name -> bits of every action (game or menu) bound to it
+        self.__key_masks: Dict[str, int] = {}
+        for group_keybinds in keybinds.values():
+            for action, keys in group_keybinds.items():
+                action_bit: int = ACTION_BITS.get(action, 0)
+                for key in keys:
+                    self.__key_masks[key] = self.__key_masks.get(key, 0) | action_bit
+
+    def action_mask(self, pressed_keys: Iterable[str]) -> int:
+        """This will return the bits of every action bound to the pressed keys."""
+        key_masks: Dict[str, int] = self.__key_masks
+        mask: int = 0
+        for key in pressed_keys:
+            mask |= key_masks.get(key, 0)
+        return mask
+
+
+if __name__ == "__main__":
+    print("This module is not meant to be run directly.")
@@ -0,0 +1,27 @@
+"""This will carry values from one mode to the next one."""
+
+# coding: utf-8
+
+from typing import Optional
+
+
+class ModeContext:
+    """This will hold what a mode hands to the next mode, in memory.
+
+    GameMode.change_mode passes the handoff of the old mode to the new
+    ModeClass, so nothing has to go through the database on a transition.
+    """
+
+    def __init__(self, score: Optional[int] = None, score_type: str = "Marathon") -> None:
+        """This will initialize this class."""
+        # Final score of the game that just ended, None when no game was played
+        self.score: Optional[int] = score
+        self.score_type: str = score_type
+
+    def __repr__(self) -> str:
+        """This will return the context as a string."""
+        return f"ModeContext(score={self.score!r}, score_type={self.score_type!r})"
+
+
+if __name__ == "__main__":
+    print("This module is not meant to be run directly.")
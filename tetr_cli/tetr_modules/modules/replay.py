@@ -0,0 +1,226 @@
+"""This will record solo games and play them back without a terminal."""
+
+# coding: utf-8
+
+from asyncio import sleep
+from datetime import datetime
+from pathlib import Path
+from struct import Struct
+from time import perf_counter
+from typing import Iterator, List, Optional, Tuple
+
+from tetr_cli.tetr_modules.modules.constants import (
+    ACTION_BITS,
+    GAME_ACTION_MASK,
+    GAME_ACTIONS,
+)
+from tetr_cli.tetr_modules.solo_core.game_state import GameState
+from tetr_cli.tetr_modules.solo_core.timing import get_timing_table
+
+
+REPLAY_PATH: Path = Path(__file__).parent.parent.resolve() / "replays"
+
+# File layout (little endian):
+#   header: magic, version, fps_limit, seed, frame count, final score,
+#           DAS ms, ARR ms, soft drop factor, lock delay ms, action count
+#   action names: (length byte + utf-8 name) per action, bit i of a frame is action i
+#   runs until the end of file: (action bitmask byte + varint frame count)
+REPLAY_MAGIC: bytes = b"TRPL"
+REPLAY_VERSION: int = 3
+REPLAY_HEADER: Struct = Struct("<4sBHIIIHHBHB")
+
+
+def _encode_varint(value: int) -> bytes:
+    """This will encode a non-negative int as a LEB128 varint."""
+    encoded: bytearray = bytearray()
+    while True:
+        byte: int = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+def _decode_varint(data: bytes, index: int) -> Tuple[int, int]:
+    """This will decode a LEB128 varint and return (value, next_index)."""
+    value: int = 0
+    shift: int = 0
+    while True:
+        byte: int = data[index]
+        index += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, index
+        shift += 7
+
+
+class ReplayRecorder:
+    """This will record the game actions of every frame of a solo game."""
+
+    def __init__(self, replay_dir: Path = REPLAY_PATH) -> None:
+        """This will initialize this class."""
+        self.__replay_dir: Path = replay_dir
+        self.__game: Optional[GameState] = None
+        self.__mode_name: str = ""
+        # [action bitmask, frame count], idle frames are runs of bitmask 0
+        self.__runs: List[List[int]] = []
+        self.__frame_count: int = 0
+
+    @property
+    def recording(self) -> bool:
+        """This will return if a game is being recorded."""
+        return self.__game is not None
+
+    def start(self, game: GameState, mode_name: str) -> None:
+        """This will start recording the given game."""
+        self.__game = game
+        self.__mode_name = mode_name
+        self.__runs = []
+        self.__frame_count = 0
+        game.recorder = self
+
+    def record_frame(self, inputs: int) -> None:
+        """This will record the game action bits of one frame."""
+        # Game action bits are stored as they are (see ACTION_BITS)
+        mask: int = inputs & GAME_ACTION_MASK
+        if self.__runs and self.__runs[-1][0] == mask:
+            self.__runs[-1][1] += 1
+        else:
+            self.__runs.append([mask, 1])
+        self.__frame_count += 1
+
+    def to_bytes(self) -> bytes:
+        """This will serialize the current recording."""
+        if self.__game is None:
+            raise RuntimeError("No game is being recorded.")
+        data: bytearray = bytearray(
+            REPLAY_HEADER.pack(
+                REPLAY_MAGIC,
+                REPLAY_VERSION,
+                self.__game.fps_limit,
+                self.__game.seed_value,
+                self.__frame_count,
+                self.__game.score,
+                self.__game.timing.das,
+                self.__game.timing.arr,
+                self.__game.timing.sdf,
+                self.__game.timing.lock_delay,
+                len(GAME_ACTIONS),
+            )
+        )
+        for action in GAME_ACTIONS:
+            name: bytes = action.encode("utf-8")
+            data.append(len(name))
+            data.extend(name)
+        for mask, count in self.__runs:
+            data.append(mask)
+            data.extend(_encode_varint(count))
+        return bytes(data)
+
+    def stop(self) -> Optional[Path]:
+        """This will stop recording and save the replay if any frame was played.
+
+        It runs on shutdown too, so a folder that cannot be written returns
+        None instead of raising.
+        """
+        if self.__game is None:
+            return None
+        saved_path: Optional[Path] = None
+        if self.__frame_count > 0:
+            file_name: str = (
+                f"{self.__mode_name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.trp"
+            )
+            saved_path = self.__replay_dir / file_name
+            try:
+                self.__replay_dir.mkdir(parents=True, exist_ok=True)
+                saved_path.write_bytes(self.to_bytes())
+            except OSError:
+                saved_path = None
+        self.__game.recorder = None
+        self.__game = None
+        return saved_path
+
+
+class Replay:
+    """This will hold a loaded replay."""
+
+    def __init__(self, data: bytes) -> None:
+        """This will initialize this class."""
+        magic: bytes = data[:len(REPLAY_MAGIC)]
+        version: int = data[len(REPLAY_MAGIC)] if len(data) > len(REPLAY_MAGIC) else 0
+        if magic != REPLAY_MAGIC or not 0 < version <= REPLAY_VERSION:
+            raise ValueError("Not a supported Tetr_CLI replay file.")
+        if version != REPLAY_VERSION:
+            raise ValueError(
+                f"This replay (version {version}) was recorded with an incompatible engine."
+            )
+
+        (
+            _,
+            _,
+            self.fps_limit,
+            self.seed_value,
+            self.frame_count,
+            self.score,
+            self.das,
+            self.arr,
+            self.sdf,
+            self.lock_delay,
+            action_count,
+        ) = REPLAY_HEADER.unpack_from(data, 0)
+        index: int = REPLAY_HEADER.size
+        self.actions: List[str] = []
+        for _ in range(action_count):
+            length: int = data[index]
+            self.actions.append(data[index + 1:index + 1 + length].decode("utf-8"))
+            index += 1 + length
+
+        self.runs: List[Tuple[int, int]] = []
+        while index < len(data):
+            mask: int = data[index]
+            count, index = _decode_varint(data, index + 1)
+            self.runs.append((mask, count))
+
+    @classmethod
+    def load(cls, path: Path) -> "Replay":
+        """This will load a replay from a file."""
+        return cls(Path(path).read_bytes())
+
+    def iter_frames(self) -> Iterator[int]:
+        """This will yield the game action bits of every recorded frame."""
+        # The file names its actions, so they are mapped onto the current bits
+        file_bits: List[int] = [ACTION_BITS.get(action, 0) for action in self.actions]
+        for mask, count in self.runs:
+            inputs: int = 0
+            for bit, action_bit in enumerate(file_bits):
+                if mask >> bit & 1:
+                    inputs |= action_bit
+            for _ in range(count):
+                yield inputs
+
+
+async def play_replay(replay: Replay, realtime: bool = False) -> GameState:
+    """This will re-run a replay headlessly, as fast as possible or at real time."""
+    game: GameState = GameState(
+        fps_limit=replay.fps_limit,
+        input_seed=replay.seed_value,
+        timing=get_timing_table(
+            replay.fps_limit, replay.das, replay.arr, replay.sdf, replay.lock_delay
+        ),
+    )
+    frame_duration: float = 1 / replay.fps_limit
+    next_frame: float = perf_counter()
+    for inputs in replay.iter_frames():
+        if realtime:
+            next_frame += frame_duration
+            delay: float = next_frame - perf_counter()
+            if delay > 0:
+                await sleep(delay)
+        game.step(inputs)
+    return game
+
+
+if __name__ == "__main__":
+    print("This module is not meant to be run directly.")
@@ -1,7 +1,120 @@
 """This module contains the curses definition for safe terminal handling."""
 
-from curses import window
-from typing import Optional, List, Tuple
+from curses import color_pair as curses_color_pair, error as curses_error, window
+from typing import Dict, Optional, List, Tuple
+
+
+# Number of curses writes since the last pop_curses_call_count, for the debug profiler
+_curses_call_count: int = 0
+
+
+def pop_curses_call_count() -> int:
+    """This will return the number of curses writes since the last call and reset it."""
+    global _curses_call_count  # pylint: disable=global-statement
+    count: int = _curses_call_count
+    _curses_call_count = 0
+    return count
+
+
+def color_pair(pair_number: int) -> int:
+    """This will return the attribute of the color pair, also before initscr()."""
+    try:
+        return curses_color_pair(pair_number)
+    except curses_error:
+        # No terminal, like in FakeWindow runs: use the ncurses attribute layout
+        return pair_number << 8
+
+
+class DrawBuffer:
+    """This will stand in for the curses window during one frame.
+
+    The screen size is read once per frame, writes are clipped to it and kept
+    per cell, and flush() sends each row as the fewest runs of the same
+    attribute, so the terminal only sees one addstr per run.
+    """
+
+    def __init__(self, stdscr: window) -> None:
+        """This will initialize this class."""
+        self.__stdscr: window = stdscr
+        self.__max_yx: Tuple[int, int] = stdscr.getmaxyx()
+        # y -> x -> (character, attribute)
+        self.__rows: Dict[int, Dict[int, Tuple[str, int]]] = {}
+        self.__clear_pending: bool = False
+        # Writes asked for by the renderers in the last frame, before merging
+        self.last_writes: int = 0
+        self.__writes: int = 0
+
+    @property
+    def stdscr(self) -> window:
+        """This will return the wrapped curses window."""
+        return self.__stdscr
+
+    def begin_frame(self) -> None:
+        """This will read the screen size for the new frame."""
+        self.__max_yx = self.__stdscr.getmaxyx()
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        """This will return the screen size cached for this frame."""
+        return self.__max_yx
+
+    def addstr(self, y: int, x: int, string: str, attr: int = 0) -> None:
+        """This will keep the string for the next flush, clipped to the screen."""
+        max_y, max_x = self.__max_yx
+        if not (0 <= y < max_y and 0 <= x < max_x):
+            return
+        self.__writes += 1
+        string = string[:max_x - x]
+        row: Optional[Dict[int, Tuple[str, int]]] = self.__rows.get(y)
+        if row is None:
+            row = self.__rows[y] = {}
+        for offset, character in enumerate(string):
+            row[x + offset] = (character, attr)
+
+    def clear(self) -> None:
+        """This will clear the screen on the next flush, dropping what is pending."""
+        self.__rows.clear()
+        self.__clear_pending = True
+
+    def noutrefresh(self) -> None:
+        """This will flush the pending writes and mark the window for doupdate."""
+        self.flush()
+        self.__stdscr.noutrefresh()
+
+    def flush(self) -> int:
+        """This will write the pending cells as runs and return the addstr calls made."""
+        global _curses_call_count  # pylint: disable=global-statement
+        if self.__clear_pending:
+            self.__stdscr.clear()
+            self.__clear_pending = False
+        calls: int = 0
+        for y, row in self.__rows.items():
+            run_x: int = -2
+            run_attr: int = 0
+            run: List[str] = []
+            for x in sorted(row):
+                character, attr = row[x]
+                if x == run_x + len(run) and attr == run_attr:
+                    run.append(character)
+                    continue
+                if run:
+                    calls += self.__write_run(y, run_x, "".join(run), run_attr)
+                run_x, run_attr, run = x, attr, [character]
+            if run:
+                calls += self.__write_run(y, run_x, "".join(run), run_attr)
+        self.__rows.clear()
+        self.last_writes = self.__writes
+        self.__writes = 0
+        _curses_call_count += calls
+        return calls
+
+    def __write_run(self, y: int, x: int, string: str, attr: int) -> int:
+        """This will write one run to the curses window."""
+        try:
+            self.__stdscr.addstr(y, x, string, attr)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # The bottom right cell raises after it is written
+            pass
+        return 1
 
 
 def safe_addstr(
@@ -12,11 +125,17 @@ def safe_addstr(
     attr: Optional[int] = None,
 ) -> None:
     """This will safely add a string to the curses window."""
+    global _curses_call_count  # pylint: disable=global-statement
+    if isinstance(stdscr, DrawBuffer):
+        # Clipped and counted by the buffer itself
+        stdscr.addstr(y, x, string, attr or 0)
+        return
     max_y, max_x = stdscr.getmaxyx()
     if (
         (0 <= y < max_y)
         and (0 <= x < max_x)
     ):
+        _curses_call_count += 1
         try:
             if attr is not None:
                 stdscr.addstr(y, x, string, attr)
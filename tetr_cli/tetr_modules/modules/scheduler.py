@@ -0,0 +1,56 @@
+"""This will keep the main loop on a fixed timestep."""
+
+# coding: utf-8
+
+from asyncio import sleep
+from time import perf_counter
+
+from tetr_cli.tetr_modules.modules.constants import MAX_CATCH_UP_TICKS
+from tetr_cli.tetr_modules.modules.debug import LatencyHistogram
+
+
+class FrameScheduler:
+    """This will wait for absolute frame deadlines instead of sleeping a frame each time.
+
+    Sleep overshoot is not carried into the next frame, so the tick rate stays at
+    the frame limit. When the loop falls behind, wait() returns the ticks that are
+    due, so game logic can catch up without drawing each one.
+    """
+
+    def __init__(self, frame_limit: int, max_catch_up: int = MAX_CATCH_UP_TICKS) -> None:
+        """This will initialize this class."""
+        self.frame_duration: float = 1 / frame_limit
+        self.max_catch_up: int = max_catch_up
+        self.__next_deadline: float = perf_counter()
+
+        # How late each wake up was, in microseconds
+        self.jitter: LatencyHistogram = LatencyHistogram()
+        self.dropped_ticks: int = 0
+
+    def set_frame_limit(self, frame_limit: int) -> None:
+        """This will change the frame limit starting from the next frame."""
+        self.frame_duration = 1 / frame_limit
+        self.__next_deadline = perf_counter() + self.frame_duration
+
+    async def wait(self) -> int:
+        """This will sleep until the next deadline and return the number of ticks due."""
+        delay: float = self.__next_deadline - perf_counter()
+        if delay > 0:
+            await sleep(delay)
+        now: float = perf_counter()
+        late: float = now - self.__next_deadline
+        self.jitter.record(int(late * 1_000_000))
+
+        ticks: int = 1 + int(late / self.frame_duration)
+        if ticks > 1 + self.max_catch_up:
+            # Too far behind, drop the extra ticks instead of spiralling
+            self.dropped_ticks += ticks - 1 - self.max_catch_up
+            ticks = 1 + self.max_catch_up
+            self.__next_deadline = now + self.frame_duration
+        else:
+            self.__next_deadline += ticks * self.frame_duration
+        return ticks
+
+
+if __name__ == "__main__":
+    print("This is a module, please run starter.py.")
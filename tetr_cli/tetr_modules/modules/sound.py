@@ -2,63 +2,219 @@
 
 # coding: utf-8
 
+from collections import deque
 from pathlib import Path
-from typing import Dict, List
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Deque, Dict, List, Optional, Tuple, Union
 from pygame import mixer
-from pygame.mixer import Sound
+from pygame.mixer import Channel, Sound
 
 
 current_path: Path = Path(__file__).parent.parent.resolve()
 sound_path: Path = current_path / "sounds"
 
+# Sound effects playing at the same time, and frames of them waiting to be played
+MAX_SFX_VOICES: int = 8
+AUDIO_QUEUE_SIZE: int = 16
 
-async def load_sfx() -> Dict[str, Sound]:
-    """Load all sound effects."""
-
-    mixer.init()
-
-    sound_effects = {
-        "select_move": mixer.Sound(str(sound_path / "sfx/select_move.wav")),
-        "select_confirm": mixer.Sound(str(sound_path / "sfx/select_confirm.wav")),
-        "select_back": mixer.Sound(str(sound_path / "sfx/select_back.wav")),
-        "single": mixer.Sound(str(sound_path / "sfx/single.wav")),
-        "double": mixer.Sound(str(sound_path / "sfx/double.wav")),
-        "quad": mixer.Sound(str(sound_path / "sfx/quad.wav")),
-        "t_spin_single": mixer.Sound(str(sound_path / "sfx/t_spin_single.wav")),
-        "t_spin_double": mixer.Sound(str(sound_path / "sfx/t_spin_double.wav")),
-        "t_spin_triple": mixer.Sound(str(sound_path / "sfx/t_spin_triple.wav")),
-        "countdown": mixer.Sound(str(sound_path / "sfx/countdown.wav")),
-        "go": mixer.Sound(str(sound_path / "sfx/go.wav")),
-    }
-    return sound_effects
-
-
-async def play_sounds(
-    sound_action: Dict[str, List[str]],
-    current_bgm: str,
-    sound_effect_dict: Dict[str, Sound],
-) -> str:
-    """Play sounds."""
-
-    if sound_action and "BGM" in sound_action:
-        if not sound_action["BGM"] or sound_action["BGM"][0] == "stop":
-            mixer.music.stop()
-            current_bgm = ""
-        elif sound_action["BGM"][0] != current_bgm:
-            current_bgm = sound_action["BGM"][0]
-            try:
-                mixer.music.load(str(sound_path / f"bgm/{current_bgm}.wav"))
-                mixer.music.play(-1)
-            except Exception as err:
-                print(f"Failed to load or play BGM: {err}")
-
-    if sound_action and "SFX" in sound_action:
-        for sfx in sound_action["SFX"]:
-            try:
-                sound_effect_dict[sfx].play()
-            except Exception as err:
-                print(f"Failed to play SFX: {err}")
-    return current_bgm
+
+SFX_FILES: Dict[str, str] = {
+    "select_move": "sfx/select_move.wav",
+    "select_confirm": "sfx/select_confirm.wav",
+    "select_back": "sfx/select_back.wav",
+    "single": "sfx/single.wav",
+    "double": "sfx/double.wav",
+    "quad": "sfx/quad.wav",
+    "t_spin_single": "sfx/t_spin_single.wav",
+    "t_spin_double": "sfx/t_spin_double.wav",
+    "t_spin_triple": "sfx/t_spin_triple.wav",
+    "countdown": "sfx/countdown.wav",
+    "go": "sfx/Go.wav",
+}
+
+
+class AudioAssetManager:
+    """This will decode the sound effects in the background and stream the BGM.
+
+    Sound effects are decoded by a worker thread after startup, and any effect
+    asked for before the worker reaches it is decoded on first use. BGM is
+    streamed by mixer.music, opened from the AudioDispatcher thread.
+    """
+
+    def __init__(
+        self, sfx_files: Optional[Dict[str, str]] = None, sound_dir: Path = sound_path
+    ) -> None:
+        """This will initialize this class."""
+        self.__sfx_files: Dict[str, str] = sfx_files if sfx_files is not None else SFX_FILES
+        self.__sound_dir: Path = sound_dir
+        self.__sounds: Dict[str, Optional[Sound]] = {}
+        self.__sfx_lock: Lock = Lock()
+
+        # Per asset: load time in microseconds and decoded size in bytes
+        self.asset_stats: Dict[str, Dict[str, Union[int, float]]] = {}
+
+    def start_preload(self) -> Thread:
+        """This will decode every sound effect in a background thread."""
+        thread: Thread = Thread(target=self.preload, name="sfx_decoder", daemon=True)
+        thread.start()
+        return thread
+
+    def preload(self) -> None:
+        """This will decode every sound effect that is not loaded yet."""
+        for name in self.__sfx_files:
+            self.get_sfx(name)
+
+    def get_sfx(self, name: str) -> Optional[Sound]:
+        """This will return the sound effect, decoding it if needed."""
+        with self.__sfx_lock:
+            if name not in self.__sounds:
+                self.__sounds[name] = self.__decode(name)
+            return self.__sounds[name]
+
+    def __decode(self, name: str) -> Optional[Sound]:
+        """This will decode one sound effect and record its cost."""
+        file_name: Optional[str] = self.__sfx_files.get(name)
+        if file_name is None:
+            return None
+        start_time: float = perf_counter()
+        try:
+            sound: Sound = Sound(str(self.__sound_dir / file_name))
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.asset_stats[name] = {"load_us": 0, "bytes": 0, "missing": 1}
+            return None
+        self.asset_stats[name] = {
+            "load_us": int((perf_counter() - start_time) * 1_000_000),
+            "bytes": len(sound.get_raw()),
+            "missing": 0,
+        }
+        return sound
+
+    def play_bgm(self, name: str) -> None:
+        """This will open and loop the BGM. It blocks, so call it from the audio thread."""
+        start_time: float = perf_counter()
+        try:
+            mixer.music.load(str(self.__sound_dir / f"bgm/{name}.wav"))
+            mixer.music.play(-1)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.asset_stats[f"bgm/{name}"] = {"load_us": 0, "bytes": 0, "missing": 1}
+            return
+        # Music is streamed from the file, nothing is kept decoded in memory
+        self.asset_stats[f"bgm/{name}"] = {
+            "load_us": int((perf_counter() - start_time) * 1_000_000),
+            "bytes": 0,
+            "missing": 0,
+        }
+
+    def stop_bgm(self) -> None:
+        """This will stop the BGM."""
+        mixer.music.stop()
+
+    def report(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """This will return the load time and memory of every asset loaded so far."""
+        return dict(self.asset_stats)
+
+
+class AudioDispatcher:
+    """This will run every mixer call on its own thread.
+
+    The frame loop only calls submit(), which appends to a bounded deque and
+    sets an event; deque appends and pops are atomic, so no lock is taken on
+    the render thread. SFX are de-duplicated per frame and at most max_voices
+    of them play at once, the oldest voice is cut when a new one starts.
+    """
+
+    def __init__(
+        self,
+        audio_assets: AudioAssetManager,
+        max_voices: int = MAX_SFX_VOICES,
+        queue_size: int = AUDIO_QUEUE_SIZE,
+    ) -> None:
+        """This will initialize this class."""
+        self.__audio_assets: AudioAssetManager = audio_assets
+        self.__max_voices: int = max_voices
+        # One entry per frame that had sound effects, oldest dropped when full
+        self.__sfx_queue: Deque[Tuple[str, ...]] = deque(maxlen=queue_size)
+        self.__wake_event: Event = Event()
+        self.__running: bool = False
+        self.__thread: Optional[Thread] = None
+
+        # BGM is a state rather than an event, only the latest request matters
+        self.__requested_bgm: str = ""
+        self.__submitted_bgm: str = ""
+        self.__playing_bgm: str = ""
+        self.__voices: Deque[Channel] = deque()
+
+    def start(self) -> None:
+        """This will start the audio thread."""
+        if self.__thread is not None:
+            return
+        self.__running = True
+        self.__thread = Thread(target=self.__run, name="audio_dispatcher", daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """This will stop the audio thread after it plays what is queued."""
+        if self.__thread is None:
+            return
+        self.__running = False
+        self.__wake_event.set()
+        self.__thread.join(timeout=1.0)
+        self.__thread = None
+
+    def submit(self, sound_action: Dict[str, List[str]]) -> None:
+        """This will hand the sound action of one frame to the audio thread."""
+        changed: bool = False
+        if "BGM" in sound_action:
+            bgm_list: List[str] = sound_action["BGM"]
+            requested_bgm: str = "" if not bgm_list or bgm_list[0] == "stop" else bgm_list[0]
+            if requested_bgm != self.__submitted_bgm:
+                self.__submitted_bgm = requested_bgm
+                self.__requested_bgm = requested_bgm
+                changed = True
+        if sound_action.get("SFX"):
+            # dict keeps the order, so this drops repeats within the frame
+            self.__sfx_queue.append(tuple(dict.fromkeys(sound_action["SFX"])))
+            changed = True
+        if changed:
+            self.__wake_event.set()
+
+    def __run(self) -> None:
+        """This will wait for sound actions and play them."""
+        while True:
+            self.__wake_event.wait()
+            self.__wake_event.clear()
+
+            requested_bgm: str = self.__requested_bgm
+            if requested_bgm != self.__playing_bgm:
+                self.__playing_bgm = requested_bgm
+                if requested_bgm:
+                    self.__audio_assets.play_bgm(requested_bgm)
+                else:
+                    self.__audio_assets.stop_bgm()
+
+            while self.__sfx_queue:
+                for name in self.__sfx_queue.popleft():
+                    self.__play_sfx(name)
+
+            if not self.__running:
+                return
+
+    def __play_sfx(self, name: str) -> None:
+        """This will play one sound effect within the voice limit."""
+        sound: Optional[Sound] = self.__audio_assets.get_sfx(name)
+        if sound is None:
+            return
+        while self.__voices and not self.__voices[0].get_busy():
+            self.__voices.popleft()
+        if len(self.__voices) >= self.__max_voices:
+            self.__voices.popleft().stop()
+        try:
+            channel: Optional[Channel] = sound.play()
+        except Exception:  # pylint: disable=broad-exception-caught
+            return
+        if channel is not None:
+            self.__voices.append(channel)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+"""This will time the renderers on a FakeWindow, without a terminal."""
+
+# coding: utf-8
+
+from random import Random, seed as random_seed
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Set, Tuple, Union
+
+from tetr_cli.tetr_modules.modes.main_menu_mode import ModeClass as MainMenuMode
+from tetr_cli.tetr_modules.modes.solo.marathon_mode import ModeClass as MarathonMode
+from tetr_cli.tetr_modules.modules.constants import GAME_ACTIONS
+from tetr_cli.tetr_modules.modules.debug import DebugClass, FrameProfiler, LatencyHistogram
+from tetr_cli.tetr_modules.modules.fake_window import FakeWindow
+from tetr_cli.tetr_modules.modules.safe_curses import DrawBuffer
+
+
+# (max_y, max_x), from the minimum size up to a large terminal
+BENCH_SIZES: Tuple[Tuple[int, int], ...] = ((24, 80), (30, 100), (50, 200))
+BENCH_FRAMES: int = 600
+BENCH_SEED: int = 5
+
+# Draws one frame into the buffer, given the frame number
+FrameFunction = Callable[[DrawBuffer, int], None]
+
+
+def _main_menu_frames() -> FrameFunction:
+    """This will return a main menu that moves the cursor every 10 frames."""
+    mode: MainMenuMode = MainMenuMode()
+
+    def draw(stdscr: DrawBuffer, frame: int) -> None:
+        mode.increment_frame(stdscr, {"down"} if frame % 10 == 0 else set())
+        mode.pop_action()
+        mode.pop_sound_action()
+
+    return draw
+
+
+def _marathon_frames() -> FrameFunction:
+    """This will return a marathon game played with seeded random inputs."""
+    random_seed(BENCH_SEED)
+    rng: Random = Random(BENCH_SEED)
+    modes: List[MarathonMode] = [MarathonMode()]
+    game_keys: List[str] = sorted(
+        set().union(*(modes[0].get_user_keybind(action) for action in GAME_ACTIONS))
+    )
+
+    def draw(stdscr: DrawBuffer, _frame: int) -> None:
+        if modes[0].mode == "game_over":
+            modes[0] = MarathonMode()
+        mode: MarathonMode = modes[0]
+        mode.mode = "play"
+        pressed_keys: Set[str] = set()
+        if rng.random() < 0.4:
+            pressed_keys = set(rng.sample(game_keys, rng.randrange(0, 3)))
+        mode.increment_frame(stdscr, pressed_keys)
+        mode.pop_action()
+        mode.pop_sound_action()
+
+    return draw
+
+
+def _game_over_frames() -> FrameFunction:
+    """This will return a marathon game that is over and waits for confirm."""
+    random_seed(BENCH_SEED)
+    mode: MarathonMode = MarathonMode()
+    mode.game.game_over = True
+    mode.mode = "game_over"
+
+    def draw(stdscr: DrawBuffer, _frame: int) -> None:
+        mode.increment_frame(stdscr, set())
+        mode.pop_action()
+        mode.pop_sound_action()
+
+    return draw
+
+
+def _debug_overlay_frames() -> FrameFunction:
+    """This will return the debug overlay with a frame profiler."""
+    debug_stats: DebugClass = DebugClass()
+    profiler: FrameProfiler = FrameProfiler()
+
+    def draw(stdscr: DrawBuffer, _frame: int) -> None:
+        debug_stats.update_debug(stdscr=stdscr, profiler=profiler)
+
+    return draw
+
+
+BENCH_SCENARIOS: Dict[str, Callable[[], FrameFunction]] = {
+    "main_menu": _main_menu_frames,
+    "marathon": _marathon_frames,
+    "game_over": _game_over_frames,
+    "debug_overlay": _debug_overlay_frames,
+}
+
+
+def bench_scenario(
+    name: str, max_yx: Tuple[int, int], frames: int = BENCH_FRAMES
+) -> Dict[str, Union[int, float]]:
+    """This will draw the scenario for the given frames and return the cost per frame."""
+    window: FakeWindow = FakeWindow(*max_yx)
+    draw_buffer: DrawBuffer = DrawBuffer(window)  # type: ignore[arg-type]
+    draw: FrameFunction = BENCH_SCENARIOS[name]()
+    frame_time: LatencyHistogram = LatencyHistogram()
+    writes: int = 0
+
+    for frame in range(frames):
+        start_time: int = perf_counter_ns()
+        draw_buffer.begin_frame()
+        draw(draw_buffer, frame)
+        draw_buffer.flush()
+        frame_time.record(perf_counter_ns() - start_time)
+        writes += draw_buffer.last_writes
+
+    return {
+        "frames": frames,
+        "p50_us": frame_time.percentile(50) / 1000,
+        "p99_us": frame_time.percentile(99) / 1000,
+        "max_us": frame_time.max / 1000,
+        "writes_per_frame": writes / frames,
+        "addstr_per_frame": window.calls["addstr"] / frames,
+    }
+
+
+def run_render_bench(
+    sizes: Tuple[Tuple[int, int], ...] = BENCH_SIZES, frames: int = BENCH_FRAMES
+) -> None:
+    """This will run every scenario at every size and print a table."""
+    print(
+        f"{'scenario':<14}{'size':>8}{'p50 us':>10}{'p99 us':>10}{'max us':>10}"
+        f"{'writes':>9}{'addstr':>9}"
+    )
+    for name in BENCH_SCENARIOS:
+        for max_y, max_x in sizes:
+            result: Dict[str, Union[int, float]] = bench_scenario(
+                name, (max_y, max_x), frames
+            )
+            print(
+                f"{name:<14}{f'{max_y}x{max_x}':>8}"
+                f"{result['p50_us']:>10.1f}{result['p99_us']:>10.1f}"
+                f"{result['max_us']:>10.1f}"
+                f"{result['writes_per_frame']:>9.1f}{result['addstr_per_frame']:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    print("This module is not meant to be run directly, use starter.py --render-bench.")
@@ -0,0 +1,110 @@
+"""This will handle the game board stored as row bitmasks."""
+
+# coding: utf-8
+
+from typing import List, Set, Tuple
+
+from tetr_cli.tetr_modules.modules.constants import (
+    BOARD_HEIGHT,
+    BOARD_WIDTH,
+    FULL_ROW_MASK,
+    MINO_DRAW_LOCATION,
+)
+from tetr_cli.tetr_modules.solo_core.board import Board
+from tetr_cli.tetr_modules.solo_core.piece_mask import PIECE_MASKS
+
+
+class BitBoard(Board):
+    """This will handle the game board with one occupancy mask per row.
+
+    Bit x of a row mask is set when column x is filled. The colour plane of
+    Board is kept in sync, but it is only needed for drawing.
+    """
+
+    def __init__(self) -> None:
+        """This will initialize this class."""
+        super().__init__()
+        self.__row_masks: List[int] = [0] * BOARD_HEIGHT
+
+    def clear(self) -> None:
+        """This will clear the board."""
+        super().clear()
+        self.__row_masks = [0] * BOARD_HEIGHT
+
+    def place_mino(
+        self, mino: str, orientation: str, position: Tuple[int, int]
+    ) -> None:
+        """This will place the mino on the board."""
+        super().place_mino(mino, orientation, position)
+        for y_offset, x_offset in MINO_DRAW_LOCATION[mino][orientation]:
+            y_pos = position[0] + y_offset
+            x_pos = position[1] + x_offset
+            if 0 <= y_pos < BOARD_HEIGHT and 0 <= x_pos < BOARD_WIDTH:
+                self.__row_masks[y_pos] |= 1 << x_pos
+
+    def is_cell_occupied(self, position: Tuple[int, int]) -> bool:
+        """Check if a cell is occupied."""
+        y_pos, x_pos = position
+        return (
+            0 <= y_pos < BOARD_HEIGHT
+            and 0 <= x_pos < BOARD_WIDTH
+            and (self.__row_masks[y_pos] >> x_pos) & 1 == 1
+        )
+
+    def piece_fits(
+        self, mino: str, orientation: str, position: Tuple[int, int]
+    ) -> bool:
+        """This will check if the whole mino fits inside the board at the position."""
+        row_masks, min_y, max_y, min_x, max_x = PIECE_MASKS[mino][orientation]
+        y_pos: int = position[0] + min_y
+        x_pos: int = position[1] + min_x
+        if (
+            y_pos < 0
+            or position[0] + max_y >= BOARD_HEIGHT
+            or x_pos < 0
+            or position[1] + max_x >= BOARD_WIDTH
+        ):
+            return False
+        board_masks: List[int] = self.__row_masks
+        for row_mask in row_masks:
+            if board_masks[y_pos] & (row_mask << x_pos):
+                return False
+            y_pos += 1
+        return True
+
+    def get_row_mask(self, row: int) -> int:
+        """This will return the occupancy mask of the given row."""
+        return self.__row_masks[row]
+
+    def detect_all_clear(self) -> bool:
+        """This will detect if the board is all clear."""
+        # Rows waiting in the line clear queue are full, every other row must be empty
+        for mask in self.__row_masks:
+            if mask not in (0, FULL_ROW_MASK):
+                return False
+        return True
+
+    def _is_row_full(self, row: int) -> bool:
+        """This will check if every cell of the row is filled."""
+        return self.__row_masks[row] == FULL_ROW_MASK
+
+    def _remove_rows(self, rows: List[int]) -> None:
+        """This will remove the given rows and shift the rows above down."""
+        if not rows:
+            return
+        removed: Set[int] = set(rows)
+        masks: List[int] = self.__row_masks
+        write: int = min(removed)
+        # Rows above the stack are empty and stay where they are
+        top: int = max(max(self.get_column_heights()), max(removed) + 1)
+        super()._remove_rows(rows)
+        for read in range(write, top):
+            if read not in removed:
+                masks[write] = masks[read]
+                write += 1
+        for row in range(write, top):
+            masks[row] = 0
+
+
+if __name__ == "__main__":
+    print("This is a module, not a standalone program.")
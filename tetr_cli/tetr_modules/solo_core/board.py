@@ -2,13 +2,9 @@
 
 # coding: utf-8
 
-from copy import deepcopy
-from typing import Optional, List, Tuple
-from curses import (
-    A_BOLD,
-    color_pair,
-    window,
-)
+from bisect import bisect_left
+from typing import Optional, List, Set, Tuple
+from curses import A_BOLD, window
 
 from tetr_cli.tetr_modules.modules.constants import (
     BOARD_HEIGHT,
@@ -19,8 +15,12 @@ from tetr_cli.tetr_modules.modules.constants import (
     MINO_DRAW_LOCATION,
     T_SPIN_CORNER_CHECKS,
 )
-from tetr_cli.tetr_modules.modules.safe_curses import safe_addstr
+from tetr_cli.tetr_modules.modules.safe_curses import color_pair, safe_addstr
 from tetr_cli.tetr_modules.solo_core.mino import Mino
+from tetr_cli.tetr_modules.solo_core.piece_mask import PIECE_COLUMN_BOTTOMS
+
+
+EMPTY_ROW: Tuple[int, ...] = (0,) * BOARD_WIDTH
 
 
 class Board:
@@ -28,14 +28,35 @@ class Board:
 
     def __init__(self) -> None:
         """This will initialize this class."""
-        self.__line_clear_queue: List[int] = []
+        # Only rows the last mino was placed on can become full
+        self._touched_rows: List[int] = []
+        self._line_clear_queue: List[int] = []
+        # Rows removed by the last clear_lines, for line clear animations
+        self._cleared_rows: Tuple[int, ...] = ()
         self.__board: List[List[int]] = [
             ([0] * BOARD_WIDTH) for _ in range(BOARD_HEIGHT)
         ]
 
+        # Per column: one above the highest filled cell, and the filled cell count.
+        # Holes of a column are height - filled.
+        self.__column_heights: List[int] = [0] * BOARD_WIDTH
+        self.__column_filled: List[int] = [0] * BOARD_WIDTH
+
+        # Last composed frame of draw_minos_on_board, only changed cells are redrawn
+        self.__last_frame: List[List[int]] = []
+        self.__last_frame_key: Tuple[Tuple[int, int], Tuple[int, int]] = (
+            (-1, -1),
+            (-1, -1),
+        )
+
     def clear(self) -> None:
         """This will clear the board."""
         self.__board = [([0] * BOARD_WIDTH) for _ in range(BOARD_HEIGHT)]
+        self._touched_rows = []
+        self._line_clear_queue = []
+        self._cleared_rows = ()
+        self.__column_heights = [0] * BOARD_WIDTH
+        self.__column_filled = [0] * BOARD_WIDTH
 
     def place_mino(
         self, mino: str, orientation: str, position: Tuple[int, int]
@@ -46,7 +67,50 @@ class Board:
             y_pos = position[0] + y_offset
             x_pos = position[1] + x_offset
             if 0 <= y_pos < BOARD_HEIGHT and 0 <= x_pos < BOARD_WIDTH:
+                if y_pos not in self._touched_rows:
+                    self._touched_rows.append(y_pos)
+                if self.__board[y_pos][x_pos] == 0:
+                    self.__column_filled[x_pos] += 1
                 self.__board[y_pos][x_pos] = MINO_COLOR[mino]
+                if y_pos >= self.__column_heights[x_pos]:
+                    self.__column_heights[x_pos] = y_pos + 1
+
+    def get_column_heights(self) -> Tuple[int, ...]:
+        """This will return the height of every column."""
+        return tuple(self.__column_heights)
+
+    def get_column_holes(self) -> Tuple[int, ...]:
+        """This will return the empty cells under the top of every column."""
+        return tuple(
+            height - filled
+            for height, filled in zip(self.__column_heights, self.__column_filled)
+        )
+
+    def drop_distance(
+        self, mino: str, orientation: str, position: Tuple[int, int]
+    ) -> int:
+        """This will return how many rows the mino can fall from the position.
+
+        When every column of the mino is above the stack this is a min over its
+        columns. A mino tucked under an overhang falls back to a row by row sweep.
+        """
+        distance: int = BOARD_HEIGHT
+        heights: List[int] = self.__column_heights
+        for x_offset, y_offset in PIECE_COLUMN_BOTTOMS[mino][orientation]:
+            gap: int = position[0] + y_offset - heights[position[1] + x_offset]
+            if gap < 0:
+                return self.__sweep_drop_distance(mino, orientation, position)
+            distance = min(distance, gap)
+        return distance
+
+    def __sweep_drop_distance(
+        self, mino: str, orientation: str, position: Tuple[int, int]
+    ) -> int:
+        """This will move the mino down one row at a time until it stops."""
+        y_pos, x_pos = position
+        while self.piece_fits(mino, orientation, (y_pos - 1, x_pos)):
+            y_pos -= 1
+        return position[0] - y_pos
 
     def is_cell_occupied(self, position: Tuple[int, int]) -> bool:
         """Check if a cell is occupied."""
@@ -57,6 +121,23 @@ class Board:
             and self.__board[y_pos][x_pos] != 0
         )
 
+    def piece_fits(
+        self, mino: str, orientation: str, position: Tuple[int, int]
+    ) -> bool:
+        """This will check if the whole mino fits inside the board at the position."""
+        for y_offset, x_offset in MINO_DRAW_LOCATION[mino][orientation]:
+            y_pos = position[0] + y_offset
+            x_pos = position[1] + x_offset
+            if (
+                y_pos < 0
+                or y_pos >= BOARD_HEIGHT
+                or x_pos < 0
+                or x_pos >= BOARD_WIDTH
+                or self.__board[y_pos][x_pos] != 0
+            ):
+                return False
+        return True
+
     def detect_all_clear(self) -> bool:
         """This will detect if the board is all clear."""
         for row in self.__board:
@@ -112,23 +193,75 @@ class Board:
 
         return ""
 
+    def _is_row_full(self, row: int) -> bool:
+        """This will check if every cell of the row is filled."""
+        return 0 not in self.__board[row]
+
     def check_line_clear(self) -> int:
-        """This will check if any lines are filled and queue them to be cleared."""
-        line_cleared: int = 0
-        self.__line_clear_queue.clear()
-        for row in range(BOARD_HEIGHT):
-            if all(cell != 0 for cell in self.__board[row]):
-                self.__line_clear_queue.append(row)
-                line_cleared += 1
-        return line_cleared
+        """This will check if any lines are filled and queue them to be cleared.
+
+        Only the rows touched by minos placed since the last check are looked at,
+        every other row was already checked when it was last changed.
+        """
+        self._line_clear_queue = sorted(
+            row for row in self._touched_rows if self._is_row_full(row)
+        )
+        self._touched_rows = []
+        return len(self._line_clear_queue)
 
     def clear_lines(self) -> None:
         """This will clear the lines and return the number of lines cleared."""
-        # Reverse sort to do it in ascending order
-        for row in sorted(self.__line_clear_queue, reverse=True):
-            del self.__board[row]
-            self.__board.append([0] * BOARD_WIDTH)
-        self.__line_clear_queue.clear()
+        self._cleared_rows = tuple(self._line_clear_queue)
+        self._remove_rows(self._line_clear_queue)
+        self._line_clear_queue = []
+
+    def get_cleared_rows(self) -> Tuple[int, ...]:
+        """This will return the rows removed by the last clear_lines, lowest first."""
+        return self._cleared_rows
+
+    def _remove_rows(self, rows: List[int]) -> None:
+        """This will remove the given rows and shift the rows above down.
+
+        Rows are compacted in one pass from the lowest removed row to the top of
+        the stack, and the removed row lists are emptied and reused above it.
+        """
+        if not rows:
+            return
+        removed: Set[int] = set(rows)
+        board: List[List[int]] = self.__board
+        filled: List[int] = self.__column_filled
+        for row in removed:
+            if 0 not in board[row]:
+                # Cleared lines are full, every column loses one cell
+                for column in range(BOARD_WIDTH):
+                    filled[column] -= 1
+                continue
+            for column, cell in enumerate(board[row]):
+                if cell != 0:
+                    filled[column] -= 1
+        write: int = min(removed)
+        # Rows above the stack are empty and stay where they are
+        top: int = max(max(self.__column_heights), max(removed) + 1)
+        spare_rows: List[List[int]] = []
+        for read in range(write, top):
+            if read in removed:
+                spare_rows.append(board[read])
+                continue
+            board[write] = board[read]
+            write += 1
+        for spare_row in spare_rows:
+            spare_row[:] = EMPTY_ROW
+            board[write] = spare_row
+            write += 1
+        # Every removed row under the top of a column lowers it by one,
+        # then the new top may still be an empty cell that was under it
+        sorted_rows: List[int] = sorted(removed)
+        for column in range(BOARD_WIDTH):
+            height: int = self.__column_heights[column]
+            height -= bisect_left(sorted_rows, height)
+            while height > 0 and board[height - 1][column] == 0:
+                height -= 1
+            self.__column_heights[column] = height
 
     # Drawing functions
 
@@ -148,22 +281,14 @@ class Board:
         offset: Tuple[int, int],  # (offset_y, offset_x)
     ) -> None:
         """Draw the Game board centered on the screen."""
-        # Draw top border
-        safe_addstr(
-            stdscr,
-            offset[0] - 1,
-            offset[1] - 1,
-            "+" + "- " * (DRAW_BOARD_WIDTH // 2) + "+",
-        )
-        # Draw Side Borders
-        middle_line: str = "|" + " " * DRAW_BOARD_WIDTH + "|"
+        # Draw top corners, the top line itself is drawn by draw_minos_on_board
+        safe_addstr(stdscr, offset[0] - 1, offset[1] - 1, "+")
+        safe_addstr(stdscr, offset[0] - 1, offset[1] + DRAW_BOARD_WIDTH, "+")
+        # Draw Side Borders, the inside is owned by draw_minos_on_board
         for row in range(DRAW_BOARD_HEIGHT):
+            safe_addstr(stdscr, offset[0] + row, offset[1] - 1, "|", A_BOLD)
             safe_addstr(
-                stdscr,
-                offset[0] + row,
-                offset[1] - 1,
-                middle_line,
-                A_BOLD,
+                stdscr, offset[0] + row, offset[1] + DRAW_BOARD_WIDTH, "|", A_BOLD
             )
         # Draw bottom border
         safe_addstr(
@@ -174,6 +299,10 @@ class Board:
             A_BOLD,
         )
 
+    def invalidate_frame(self) -> None:
+        """This will make the next draw_minos_on_board redraw every cell."""
+        self.__last_frame = []
+
     def draw_minos_on_board(
         self,
         stdscr: window,
@@ -182,65 +311,79 @@ class Board:
         current_mino: Optional["Mino"] = None,  # type: ignore
         ghost_position: Tuple[int, int] = (-1, -1),
     ) -> None:
-        """Draw the minos on the board."""
+        """Draw the minos on the board, only the cells changed since the last frame."""
 
-        draw_board: List[List[int]] = deepcopy(self.__board)
+        max_rows: int = min(max_yx[0], BOARD_HEIGHT)
+        draw_board: List[List[int]] = [row[:] for row in self.__board[0:max_rows]]
         mino_shape: List[Tuple[int, int]] = []
 
         if current_mino:
             mino_shape = MINO_DRAW_LOCATION[current_mino.type][current_mino.orientation]
+            mino_color: int = MINO_COLOR[current_mino.type]
 
             # Draw ghost Mino
             for y_offset, x_offset in mino_shape:
                 y_pos = ghost_position[0] + y_offset
                 x_pos = ghost_position[1] + x_offset
-                if 0 <= y_pos < BOARD_HEIGHT and 0 <= x_pos < BOARD_WIDTH:
+                if 0 <= y_pos < max_rows and 0 <= x_pos < BOARD_WIDTH:
                     if draw_board[y_pos][x_pos] == 0:
-                        draw_board[y_pos][x_pos] = -MINO_COLOR[
-                            current_mino.type
-                        ]  # Ghost block
+                        draw_board[y_pos][x_pos] = -mino_color  # Ghost block
 
             # Draw current Mino
             mino_position: Tuple[int, int] = current_mino.position
             for y_offset, x_offset in mino_shape:
                 y_pos = mino_position[0] + y_offset
                 x_pos = mino_position[1] + x_offset
-                if 0 <= y_pos < BOARD_HEIGHT and 0 <= x_pos < BOARD_WIDTH:
-                    draw_board[y_pos][x_pos] = MINO_COLOR[current_mino.type]
+                if 0 <= y_pos < max_rows and 0 <= x_pos < BOARD_WIDTH:
+                    draw_board[y_pos][x_pos] = mino_color
             # Debug: Mark the pivot
             # draw_board[current_mino.position[0]][current_mino.position[1]] = (
             #     MINO_COLOR[current_mino.type] * 10
             # )
 
+        # A moved or resized board has nothing in common with the last frame
+        frame_key: Tuple[Tuple[int, int], Tuple[int, int]] = (offset, max_yx)
+        if frame_key != self.__last_frame_key:
+            self.__last_frame = []
+            self.__last_frame_key = frame_key
+        last_frame: List[List[int]] = self.__last_frame
+
         # Draw cells
-        max_rows: int = min(max_yx[0], BOARD_HEIGHT)
         # This is to adjust the drawing height if the terminal is too small
         adjusted_height: int = max_rows - DRAW_BOARD_HEIGHT
-        visible_rows: List[List[int]] = draw_board[0:max_rows]
-        for y_counter, row in enumerate(visible_rows):
+        for y_counter, row in enumerate(draw_board):
             # y_counter=0 is bottom, y_counter=20 is top of box
+            last_row: Optional[List[int]] = None
+            if y_counter < len(last_frame):
+                last_row = last_frame[y_counter]
+                if last_row == row:
+                    continue
+            # The extra -1 is to adjust for zero indexing
+            y: int = offset[0] + ((max_rows - 1) - y_counter) - adjusted_height
+            if not 0 <= y < max_yx[0]:
+                continue
             for x_counter, cell in enumerate(row):
+                if last_row is not None and last_row[x_counter] == cell:
+                    continue
                 char: str = "  "
-                if visible_rows[y_counter][x_counter] > 0:
+                if cell > 0:
                     char = "██"
                     # Debug for marking pivot
-                    # char = "██" if visible_rows[y_counter][x_counter] < 10 else "●●"
-                elif visible_rows[y_counter][x_counter] < 0:
+                    # char = "██" if cell < 10 else "●●"
+                elif cell < 0:
                     char = "▒▒"
                 elif y_counter == 20:
                     char = "- "
-                # The extra -1 is to adjust for zero indexing
-                y: int = offset[0] + ((max_rows - 1) - y_counter) - adjusted_height
                 x: int = offset[1] + x_counter * 2
-                color: int = abs(cell)
-                if 0 <= y < max_yx[0] and 0 <= x < max_yx[1] - 1:
+                if 0 <= x < max_yx[1] - 1:
                     safe_addstr(
                         stdscr,
                         y,
                         x,
                         char,
-                        color_pair(color) if cell else A_BOLD,
+                        color_pair(abs(cell)) if cell else A_BOLD,
                     )
+        self.__last_frame = draw_board
 
     def draw_queue(
         self,
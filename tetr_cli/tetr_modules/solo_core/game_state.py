@@ -0,0 +1,401 @@
+"""This holds the rules of a solo game, without any curses drawing."""
+
+# coding: utf-8
+
+from random import Random, randint
+from typing import TYPE_CHECKING, Optional, List, Tuple, Type
+
+from tetr_cli.tetr_modules.modules.constants import MINO_TYPES
+from tetr_cli.tetr_modules.modules.keybinds import (
+    HARD_DROP,
+    HOLD_PIECE,
+    MOVE_LEFT,
+    MOVE_RIGHT,
+    ROTATE_CCW,
+    ROTATE_CW,
+    SOFT_DROP,
+)
+from tetr_cli.tetr_modules.solo_core.bit_board import BitBoard
+from tetr_cli.tetr_modules.solo_core.board import Board
+from tetr_cli.tetr_modules.solo_core.mino import LOCK_COUNT, SPAWN_POSITION, Mino
+from tetr_cli.tetr_modules.solo_core.timing import (
+    TIMER_EPSILON,
+    TimingTable,
+    get_timing_table,
+)
+from tetr_cli.tetr_modules.modules.score import (
+    calculate_drop_score,
+    calculate_line_score,
+)
+
+if TYPE_CHECKING:
+    from tetr_cli.tetr_modules.modules.replay import ReplayRecorder
+
+
+class GameState:
+    """This will hold the state of a solo game and advance it one frame at a time.
+
+    Inputs are a bitmask of game actions (see ACTION_BITS), so it can be
+    driven by the curses modes, replays or bots alike.
+    """
+
+    def __init__(
+        self,
+        fps_limit: int,
+        input_seed: int = 0,
+        board_class: Type[Board] = BitBoard,
+        timing: Optional[TimingTable] = None,
+    ) -> None:
+        """This will initialize this class."""
+        self.fps_limit: int = fps_limit
+        # Handling and gravity in milliseconds, one step is timing.tick_ms long
+        self.timing: TimingTable = timing if timing is not None else get_timing_table(fps_limit)
+
+        # Game stats
+        self.level: int = 1
+        self.back_to_back: bool = False
+        self.combo_count: int = 0
+        self.lines_cleared: int = 0
+        self.score: int = 0
+        self.game_over: bool = False
+
+        # Board
+        self.board: Board = board_class()
+
+        # Mino
+        self.current_mino: Optional[Mino] = None
+
+        # Queue
+        self.mino_list: List[str] = []
+        self.__seed_value: int = 0
+        self.__random: Random = Random()
+
+        # Hold
+        self.current_hold: Optional[Mino] = None
+        self.hold_used: bool = False
+
+        # User inputs, the actions that must be released before they act again
+        self.keyinput_cooldown: int = 0
+        self.recorder: Optional["ReplayRecorder"] = None
+
+        # Events from the last step, for the renderer
+        self.sound_events: List[str] = []
+        self.action_text: List[str] = []
+        self.cleared_rows: Tuple[int, ...] = ()
+
+        # Optimizations for ghost position
+        self._last_ghost_check: Tuple[Tuple[int, int], str, str] = ((-1, -1), "", "")
+        self._last_ghost_result: Tuple[int, int] = (-1, -1)
+
+        self.mino_list_generator(initial=True, input_seed=input_seed)
+
+    @property
+    def seed_value(self) -> int:
+        """This will return the seed used for the mino queue."""
+        return self.__seed_value
+
+    def mino_list_generator(self, initial: bool = False, input_seed: int = 0) -> None:
+        """This will generate the next mino."""
+        new_mino_list: List[str] = []
+        if initial:
+            if self.__seed_value == 0:
+                self.__seed_value = (
+                    randint(1, 1000000000) if input_seed == 0 else input_seed
+                )
+            self.__random.seed(self.__seed_value)
+            while len(self.mino_list) <= 14:
+                # Sorted so the same seed gives the same queue on every run
+                new_mino_list = sorted(MINO_TYPES)
+                self.__random.shuffle(new_mino_list)
+                self.mino_list.extend(new_mino_list)
+        new_mino_list = sorted(MINO_TYPES)
+        self.__random.shuffle(new_mino_list)
+        self.mino_list.extend(new_mino_list)
+
+    def reset_mino(
+        self, current_mino_check: bool = False, hold_used_check: bool = False
+    ) -> None:
+        """This will reset the current mino."""
+        self.current_mino = None if not current_mino_check else self.current_mino
+        if self.current_mino:
+            self.current_mino.kick_number = 0
+        self.hold_used = hold_used_check
+        self._last_ghost_check = ((-1, -1), "", "")
+        self._last_ghost_result = (-1, -1)
+
+    def is_piece_valid(
+        self,
+        mino_type: str,
+        orientation: str,
+        position: Tuple[int, int],
+    ) -> bool:
+        """This will check if the mino fits on the board at the position."""
+        return self.board.piece_fits(mino_type, orientation, position)
+
+    def mino_touching_bottom(
+        self,
+        mino: Optional[Mino] = None,
+    ) -> bool:
+        """This will check if the current mino is touching the bottom."""
+        if mino is None:
+            return False
+        y_pos, x_pos = mino.position
+        return not self.board.piece_fits(mino.type, mino.orientation, (y_pos - 1, x_pos))
+
+    def mino_touching_side(
+        self,
+        direction: str,
+        mino: Optional[Mino] = None,
+    ) -> bool:
+        """This will check if the current mino is touching the side."""
+        if mino is None:
+            return False
+        y_pos, x_pos = mino.position
+        if direction == "left":
+            return not self.board.piece_fits(
+                mino.type, mino.orientation, (y_pos, x_pos - 1)
+            )
+        if direction == "right":
+            return not self.board.piece_fits(
+                mino.type, mino.orientation, (y_pos, x_pos + 1)
+            )
+        return False
+
+    def ghost_mino_position(
+        self,
+        current_mino: Optional[Mino],
+    ) -> Tuple[int, int]:
+        """This will return the ghost mino position."""
+        if current_mino is None:
+            return (-1, -1)
+        key: Tuple[Tuple[int, int], str, str] = (
+            current_mino.position,
+            current_mino.orientation,
+            current_mino.type,
+        )
+        if key == self._last_ghost_check and self._last_ghost_result is not None:
+            return self._last_ghost_result
+        # Otherwise, calculate as usual
+        y_pos, x_pos = current_mino.position
+        result: Tuple[int, int] = (
+            y_pos
+            - self.board.drop_distance(
+                current_mino.type, current_mino.orientation, current_mino.position
+            ),
+            x_pos,
+        )
+        self._last_ghost_check = key
+        self._last_ghost_result = result
+        return result
+
+    def calculate_score(self, rows_dropped: int = 0) -> None:
+        """This will calculate the score from hard drop."""
+
+        self.score += calculate_drop_score(
+            soft_drop_distance=0,
+            hard_drop_distance=rows_dropped,
+        )
+
+        lines_clear_detected: int = self.board.check_line_clear()
+        if not self.current_mino:
+            return
+        all_clear_detected: bool = self.board.detect_all_clear()
+        t_spin_detected: str = self.board.detect_t_spin(self.current_mino)
+        if lines_clear_detected > 0:
+            self.combo_count += 1
+        else:
+            self.combo_count = 0
+
+        self.board.clear_lines()
+        self.cleared_rows = self.board.get_cleared_rows()
+        action_text: List[str] = []
+        current_score, back_to_back, action_text = calculate_line_score(
+            lines_cleared=lines_clear_detected,
+            level=self.level,
+            t_spin=t_spin_detected,
+            all_clear=all_clear_detected,
+            combo=self.combo_count,
+            back_to_back=self.back_to_back,
+        )
+        self.score += current_score
+        self.back_to_back = back_to_back
+        self.lines_cleared += lines_clear_detected
+        if action_text:
+            self.action_text = action_text
+
+        if t_spin_detected:
+            if lines_clear_detected <= 1:
+                self.sound_events.append("t_spin_single")
+            elif lines_clear_detected == 2:
+                self.sound_events.append("t_spin_double")
+            elif lines_clear_detected == 3:
+                self.sound_events.append("t_spin_triple")
+        else:
+            if lines_clear_detected == 1:
+                self.sound_events.append("single")
+            elif lines_clear_detected in (2, 3):
+                self.sound_events.append("double")
+            elif lines_clear_detected == 4:
+                self.sound_events.append("quad")
+
+        # Level up for every 10 lines cleared
+        self.level = max(self.level, (self.lines_cleared // 10) + 1)
+
+    def handle_inputs(self, inputs: int) -> None:
+        """This will apply the game actions pressed this frame."""
+
+        # Rotations and hard drop act once per press
+        self.keyinput_cooldown &= inputs
+
+        if not self.current_mino:
+            return
+
+        if inputs & ROTATE_CCW and not self.keyinput_cooldown & ROTATE_CCW:
+            self.current_mino.rotate("left", self.is_piece_valid)
+            self.keyinput_cooldown |= ROTATE_CCW
+        if inputs & ROTATE_CW and not self.keyinput_cooldown & ROTATE_CW:
+            self.current_mino.rotate("right", self.is_piece_valid)
+            self.keyinput_cooldown |= ROTATE_CW
+        # Called with no move held too, so a release resets the DAS for the next tap
+        self.current_mino.handle_sideways_auto_repeat(
+            bool(inputs & MOVE_LEFT),
+            bool(inputs & MOVE_RIGHT),
+            self.mino_touching_side,
+        )
+        if inputs & SOFT_DROP:
+            if not self.mino_touching_bottom(self.current_mino):
+                rows_dropped: int = self.current_mino.soft_drop(
+                    level=self.level, is_piece_valid=self.is_piece_valid
+                )
+                self.current_mino.lock_delay = self.timing.lock_delay
+                self.score += calculate_drop_score(
+                    soft_drop_distance=rows_dropped,
+                    hard_drop_distance=0,
+                )
+        if inputs & HARD_DROP and not self.keyinput_cooldown & HARD_DROP:
+            rows_dropped = self.current_mino.hard_drop(
+                drop_distance_func=self.board.drop_distance,
+            )
+            self.board.place_mino(
+                self.current_mino.type,
+                self.current_mino.orientation,
+                self.current_mino.position,
+            )
+
+            self.calculate_score(rows_dropped)
+
+            self.reset_mino()
+            self.keyinput_cooldown |= HARD_DROP
+        if inputs & HOLD_PIECE and not inputs & HARD_DROP and not self.hold_used:
+            if self.current_hold:
+                temp: Mino = self.current_hold.clone()
+                self.current_hold = self.current_mino.clone()
+                self.current_mino = temp
+                self.current_mino.position = SPAWN_POSITION
+                self.current_mino.orientation = "N"
+                self.current_mino.fall_delay = self.current_mino.reset_fall_delay(
+                    level=self.level
+                )
+                self.current_mino.reset_lock()
+                self.reset_mino(current_mino_check=True, hold_used_check=True)
+            else:
+                self.current_hold = self.current_mino.clone()
+                self.reset_mino(hold_used_check=True)
+
+    def lock_mino(self) -> None:
+        """This will place the current mino on the board and score it."""
+        if not self.current_mino:
+            return
+        self.board.place_mino(
+            self.current_mino.type,
+            self.current_mino.orientation,
+            self.current_mino.position,
+        )
+        self.calculate_score()
+        self.reset_mino()
+
+    def apply_gravity(self, mino: Mino, dropping: bool) -> None:
+        """This will move the mino down by every row of gravity due in this step.
+
+        The rows due are counted from the fall delay, so fractional gravity
+        carries over between steps, and the rows are applied with one drop
+        distance lookup. At 20G and above the mino lands on its ghost.
+        """
+        mino.fall_delay -= self.timing.tick_ms
+        if mino.fall_delay > TIMER_EPSILON:
+            return
+        drop_distance: int = (
+            0
+            if dropping
+            else self.board.drop_distance(mino.type, mino.orientation, mino.position)
+        )
+        if drop_distance == 0:
+            # Grounded, or moved by soft and hard drop: fall as soon as it can
+            mino.fall_delay = 0.0
+            return
+        fall_delay: float = mino.reset_fall_delay(self.level)
+        rows_due: int = 1 + int(-mino.fall_delay / fall_delay)
+        mino.fall_delay += rows_due * fall_delay
+
+        rows_dropped: int = min(rows_due, drop_distance)
+        mino.position = (mino.position[0] - rows_dropped, mino.position[1])
+        mino.kick_number = 0
+
+    def handle_lock_and_gravity(self, inputs: int) -> None:
+        """This will count down the lock delay and move the mino down by gravity."""
+        if not self.current_mino:
+            return
+
+        dropping: bool = bool(inputs & (SOFT_DROP | HARD_DROP))
+        if self.mino_touching_bottom(self.current_mino):
+            mino: Mino = self.current_mino
+            if mino.position[0] < mino.lock_height:
+                mino.lock_height = mino.position[0]
+                mino.lock_count = LOCK_COUNT
+            elif inputs and not dropping and mino.lock_count > 0:
+                mino.lock_count -= 1
+                mino.lock_delay = self.timing.lock_delay
+            elif mino.lock_delay > TIMER_EPSILON:
+                mino.lock_delay -= self.timing.tick_ms
+            else:
+                self.lock_mino()
+
+        if self.current_mino:
+            self.apply_gravity(self.current_mino, dropping)
+            # With no lock delay the mino locks in the step it lands
+            if self.timing.lock_delay == 0 and self.mino_touching_bottom(self.current_mino):
+                self.lock_mino()
+
+    def step(self, inputs: int) -> None:
+        """This will advance the game by one frame with the given game action bits."""
+        self.sound_events = []
+        self.action_text = []
+        self.cleared_rows = ()
+        if self.game_over:
+            return
+        if self.recorder is not None:
+            self.recorder.record_frame(inputs)
+
+        if len(self.mino_list) <= 14:
+            self.mino_list_generator()
+        if not self.current_mino:
+            self.current_mino = Mino(
+                mino_type=self.mino_list.pop(0),
+                level=self.level,
+                fps_limit=self.fps_limit,
+                timing=self.timing,
+            )
+            if not self.is_piece_valid(
+                self.current_mino.type,
+                self.current_mino.orientation,
+                self.current_mino.position,
+            ):
+                self.game_over = True
+                return
+
+        self.handle_inputs(inputs)
+        self.handle_lock_and_gravity(inputs)
+
+
+if __name__ == "__main__":
+    print("This is a game state module for solo core.")
@@ -0,0 +1,58 @@
+"""This will hold the precomputed row masks of every mino shape."""
+
+# coding: utf-8
+
+from typing import Dict, List, Tuple
+
+from tetr_cli.tetr_modules.modules.constants import MINO_DRAW_LOCATION
+
+
+# Row masks from the lowest row up, then the bounding box as offsets from the pivot:
+# (row_masks, min_y, max_y, min_x, max_x)
+#
+# Note: bit 0 of a row mask is the column at min_x
+PieceMask = Tuple[Tuple[int, ...], int, int, int, int]
+
+
+def build_piece_mask(mino_shape: List[Tuple[int, int]]) -> PieceMask:
+    """This will build the row masks and bounding box of one mino shape."""
+    min_y: int = min(y_offset for y_offset, _ in mino_shape)
+    max_y: int = max(y_offset for y_offset, _ in mino_shape)
+    min_x: int = min(x_offset for _, x_offset in mino_shape)
+    max_x: int = max(x_offset for _, x_offset in mino_shape)
+
+    row_masks: List[int] = [0] * (max_y - min_y + 1)
+    for y_offset, x_offset in mino_shape:
+        row_masks[y_offset - min_y] |= 1 << (x_offset - min_x)
+    return tuple(row_masks), min_y, max_y, min_x, max_x
+
+
+def build_column_bottoms(mino_shape: List[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
+    """This will return (x_offset, lowest y_offset) for every column of the shape."""
+    bottoms: Dict[int, int] = {}
+    for y_offset, x_offset in mino_shape:
+        bottoms[x_offset] = min(y_offset, bottoms.get(x_offset, y_offset))
+    return tuple(sorted(bottoms.items()))
+
+
+# Mino_type -> orientation -> PieceMask
+PIECE_MASKS: Dict[str, Dict[str, PieceMask]] = {
+    mino_type: {
+        orientation: build_piece_mask(mino_shape)
+        for orientation, mino_shape in orientations.items()
+    }
+    for mino_type, orientations in MINO_DRAW_LOCATION.items()
+}
+
+# Mino_type -> orientation -> ((x_offset, lowest y_offset), ...)
+PIECE_COLUMN_BOTTOMS: Dict[str, Dict[str, Tuple[Tuple[int, int], ...]]] = {
+    mino_type: {
+        orientation: build_column_bottoms(mino_shape)
+        for orientation, mino_shape in orientations.items()
+    }
+    for mino_type, orientations in MINO_DRAW_LOCATION.items()
+}
+
+
+if __name__ == "__main__":
+    print("This is a piece mask module for solo core.")
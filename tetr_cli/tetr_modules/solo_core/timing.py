@@ -0,0 +1,115 @@
+"""This will hold the handling and gravity timings of the minos, in milliseconds."""
+
+# coding: utf-8
+
+from typing import Dict, Tuple
+
+
+# Gravity stops getting faster after this level
+MAX_TIMING_LEVEL: int = 30
+
+# Frame limit used before the settings are read
+DEFAULT_FPS_LIMIT: int = 30
+
+# Handling defaults: delayed auto shift and auto repeat rate in milliseconds,
+# and how many times faster than gravity the soft drop is
+DEFAULT_DAS: int = 167
+DEFAULT_ARR: int = 33
+DEFAULT_SDF: int = 20
+# Milliseconds a grounded mino waits before locking, 0 locks it when it lands
+DEFAULT_LOCK_DELAY: int = 500
+# Largest handling values, so they fit the replay header (two bytes, one for SDF)
+MAX_HANDLING_MS: int = 65535
+MAX_SDF: int = 255
+
+# Timers within this many milliseconds of running out have run out, so that
+# 15 ticks of 1000 / 30 ms do add up to 500 ms
+TIMER_EPSILON: float = 1e-6
+
+
+def get_fall_seconds(level: int) -> float:
+    """This will return the fall seconds for the given level."""
+    return pow((0.8 - ((level - 1) * 0.007)), (level - 1))
+
+
+class TimingTable:
+    """This will hold the timings of one handling setup, shared by every mino.
+
+    Every time is in milliseconds, and tick_ms is how much game time one
+    logic tick covers, so the handling does not depend on the frame limit
+    beyond rounding to whole ticks. fall_ms and soft_drop_ms are indexed by
+    level, index 0 is unused. Gravity faster than a row per tick drops
+    several rows at once, up to 20G where the mino lands in the tick it
+    spawns.
+    """
+
+    __slots__ = (
+        "fps_limit",
+        "tick_ms",
+        "das",
+        "arr",
+        "sdf",
+        "lock_delay",
+        "fall_ms",
+        "soft_drop_ms",
+    )
+
+    def __init__(
+        self,
+        fps_limit: int,
+        das: int = DEFAULT_DAS,
+        arr: int = DEFAULT_ARR,
+        sdf: int = DEFAULT_SDF,
+        lock_delay: int = DEFAULT_LOCK_DELAY,
+    ) -> None:
+        """This will initialize this class."""
+        self.fps_limit: int = fps_limit
+        self.tick_ms: float = 1000 / fps_limit
+        self.das: int = min(max(0, das), MAX_HANDLING_MS)
+        # 0 moves the mino to the wall in the tick the DAS runs out
+        self.arr: int = min(max(0, arr), MAX_HANDLING_MS)
+        self.sdf: int = min(max(1, sdf), MAX_SDF)
+        self.lock_delay: int = min(max(0, lock_delay), MAX_HANDLING_MS)
+
+        self.fall_ms: Tuple[float, ...] = tuple(
+            get_fall_seconds(max(1, level)) * 1000 for level in range(MAX_TIMING_LEVEL + 1)
+        )
+        self.soft_drop_ms: Tuple[float, ...] = tuple(
+            fall_ms / self.sdf for fall_ms in self.fall_ms
+        )
+
+    def get_fall_delay(self, level: int) -> float:
+        """This will return the milliseconds between gravity drops at the level."""
+        return self.fall_ms[min(level, MAX_TIMING_LEVEL)]
+
+    def get_soft_drop_delay(self, level: int) -> float:
+        """This will return the milliseconds between soft drops at the level."""
+        return self.soft_drop_ms[min(level, MAX_TIMING_LEVEL)]
+
+    def get_gravity(self, level: int) -> float:
+        """This will return the rows gravity moves per tick at the level (G)."""
+        return self.tick_ms / self.get_fall_delay(level)
+
+
+TIMING_TABLES: Dict[Tuple[int, int, int, int, int], TimingTable] = {}
+
+
+def get_timing_table(
+    fps_limit: int,
+    das: int = DEFAULT_DAS,
+    arr: int = DEFAULT_ARR,
+    sdf: int = DEFAULT_SDF,
+    lock_delay: int = DEFAULT_LOCK_DELAY,
+) -> TimingTable:
+    """This will return the timing table of the handling setup, building it once."""
+    key: Tuple[int, int, int, int, int] = (fps_limit, das, arr, sdf, lock_delay)
+    table: TimingTable = TIMING_TABLES.get(key) or TimingTable(*key)
+    TIMING_TABLES[key] = table
+    return table
+
+
+get_timing_table(DEFAULT_FPS_LIMIT)
+
+
+if __name__ == "__main__":
+    print("This is a timing module for solo core.")